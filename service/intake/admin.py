@@ -1,4 +1,14 @@
+from datetime import timedelta
+
 from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Q, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+from django.utils.functional import cached_property
 
 from .models import (
     Case,
@@ -16,23 +26,191 @@ from .models import (
 )
 
 
+class EstimatedCountPaginator(Paginator):
+    """Changelist paginator that skips SELECT COUNT(*) on big tables.
+
+    Every admin page otherwise runs an exact COUNT over the filtered
+    queryset just to draw the pagination bar. On PostgreSQL, for an
+    unfiltered changelist of a table past ``estimate_threshold`` rows, the
+    planner statistic in pg_class.reltuples is an O(1) stand-in. Filtered
+    views, small tables and other backends keep the exact count.
+    """
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        if (
+            connection.vendor == "postgresql"
+            and hasattr(self.object_list, "query")
+            and not self.object_list.query.where
+        ):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.query.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row is not None and row[0] >= self.estimate_threshold:
+                return row[0]
+        return super().count
+
+
+class RecencyFilter(admin.SimpleListFilter):
+    """Date sidebar filter with fixed recency buckets.
+
+    Filtering is a single indexed ``__gte`` range predicate, and the 7/30/90
+    day cutoffs fit intake review better than the calendar buckets
+    (today/this month/this year) of the default DateFieldListFilter.
+    Subclasses point ``field_name`` at the date column (``dates_only`` for
+    DateFields).
+    """
+
+    title = "recency"
+    parameter_name = "recency"
+    field_name = "created_at"
+    dates_only = False
+
+    def lookups(self, request, model_admin):
+        return (("7", "Last 7 days"), ("30", "Last 30 days"), ("90", "Last 90 days"))
+
+    def queryset(self, request, queryset):
+        if not self.value():
+            return queryset
+        cutoff = timezone.now() - timedelta(days=int(self.value()))
+        if self.dates_only:
+            cutoff = cutoff.date()
+        return queryset.filter(**{f"{self.field_name}__gte": cutoff})
+
+
+class CreatedRecencyFilter(RecencyFilter):
+    title = "created"
+    parameter_name = "created"
+
+
+class StartDateRecencyFilter(RecencyFilter):
+    title = "start date"
+    parameter_name = "started"
+    field_name = "start_date"
+    dates_only = True
+
+
+class OccurredRecencyFilter(RecencyFilter):
+    title = "occurred"
+    parameter_name = "occurred"
+    field_name = "occurred_at"
+
+
+class CachedRelatedFilter(admin.SimpleListFilter):
+    """Sidebar filter over an FK whose choices are served from the cache.
+
+    The default RelatedFieldListFilter re-queries the whole related table on
+    every changelist load to build the sidebar <ul>. For read-mostly
+    reference tables the choices are cached for an hour instead; subclasses
+    supply ``cache_key`` and ``load_choices()``.
+    """
+
+    cache_key = None
+    cache_ttl = 3600
+
+    def load_choices(self):
+        raise NotImplementedError
+
+    def lookups(self, request, model_admin):
+        return cache.get_or_set(self.cache_key, self.load_choices, self.cache_ttl)
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{f"{self.parameter_name}_id": self.value()})
+        return queryset
+
+
+class CachedLawFirmFilter(CachedRelatedFilter):
+    title = "law firm"
+    parameter_name = "law_firm"
+    cache_key = "intake:filter:lawfirms"
+
+    def load_choices(self):
+        return [(str(pk), name) for pk, name in LawFirm.objects.values_list("id", "name")]
+
+
+class CachedFacilityFilter(CachedRelatedFilter):
+    title = "facility"
+    parameter_name = "facility"
+    cache_key = "intake:filter:facilities"
+
+    def load_choices(self):
+        return [(str(pk), name) for pk, name in MedicalFacility.objects.values_list("id", "name")]
+
+
+class CachedContentTypeFilter(CachedRelatedFilter):
+    title = "content type"
+    parameter_name = "content_type"
+    cache_key = "intake:filter:citation_ref_ctypes"
+
+    def load_choices(self):
+        return [
+            (str(ct.pk), ct.name)
+            for ct in ContentType.objects.filter(
+                app_label="intake", model__in=CitationReference.ALLOWED_CONTENT_TYPES
+            )
+        ]
+
+
+class FullTextSearchMixin:
+    """Admin search over large TextFields without leading-wildcard LIKE scans.
+
+    Fields named in ``full_text_search_fields`` are matched with PostgreSQL
+    full-text search (SearchVector/SearchQuery, which a GIN expression index
+    can serve) instead of the default ``LIKE '%term%'`` scan. On other
+    backends (the sqlite dev database) they fall back to ``icontains`` so
+    behaviour is unchanged. Regular ``search_fields`` are still applied.
+    """
+
+    full_text_search_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if not (search_term and self.full_text_search_fields):
+            return results, may_have_duplicates
+
+        if connection.vendor == "postgresql":
+            from django.contrib.postgres.search import SearchQuery, SearchVector
+
+            # config pinned to match the GIN expression indexes in migration
+            # 0017 — the configless to_tsvector form is not indexable.
+            text_matches = queryset.annotate(
+                _search=SearchVector(*self.full_text_search_fields, config="english")
+            ).filter(_search=SearchQuery(search_term, config="english"))
+        else:
+            q = Q()
+            for field in self.full_text_search_fields:
+                q |= Q(**{f"{field}__icontains": search_term})
+            text_matches = queryset.filter(q)
+
+        return results | text_matches, True
+
+
 @admin.register(LawFirm)
 class LawFirmAdmin(admin.ModelAdmin):
     list_display = ("name", "phone", "email", "created_at")
     search_fields = ("name", "email")
-    list_filter = ("created_at",)
+    list_filter = (CreatedRecencyFilter,)
 
 
 class CaseInline(admin.TabularInline):
     model = Case
     extra = 0
     fields = ("case_number", "status", "incident_type", "incident_date")
+    readonly_fields = fields
+    can_delete = False
     show_change_link = True
 
 
 class InsuranceProviderInline(admin.TabularInline):
     model = InsuranceProvider
     extra = 0
+    max_num = 25
     fields = ("company_name", "coverage_type", "policy_number", "claim_number")
     show_change_link = True
     fk_name = "insured_client"
@@ -40,44 +218,76 @@ class InsuranceProviderInline(admin.TabularInline):
 
 @admin.register(Client)
 class ClientAdmin(admin.ModelAdmin):
-    list_display = ("__str__", "law_firm", "email", "phone", "created_at")
+    list_display = ("display_name", "law_firm", "email", "phone", "created_at")
+    list_select_related = ("law_firm",)
     search_fields = ("first_name", "last_name", "email")
-    list_filter = ("law_firm", "created_at")
+    list_filter = (CachedLawFirmFilter, CreatedRecencyFilter)
     inlines = [CaseInline, InsuranceProviderInline]
 
 
 class OtherPartyInline(admin.TabularInline):
     model = OtherParty
     extra = 0
+    max_num = 25
     fields = ("first_name", "last_name", "company_name", "role")
     show_change_link = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            "id", "case_id", "first_name", "last_name", "company_name", "role"
+        )
+
 
 class TreatmentInline(admin.TabularInline):
     model = Treatment
     extra = 0
+    max_num = 25
     fields = ("treatment_type", "provider", "start_date", "billed_amount")
+    raw_id_fields = ("provider",)
     show_change_link = True
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("provider")
+            .only(
+                "id", "case_id", "treatment_type", "start_date", "billed_amount",
+                "provider__first_name", "provider__last_name",
+            )
+        )
+
 
 class DamageInline(admin.TabularInline):
     model = Damage
     extra = 0
+    max_num = 25
     fields = ("category", "estimated_amount", "documented")
     show_change_link = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            "id", "case_id", "category", "estimated_amount", "documented"
+        )
+
 
 @admin.register(Case)
 class CaseAdmin(admin.ModelAdmin):
     list_display = ("case_number", "client", "status", "incident_type", "incident_date", "outcome_value", "created_at")
+    list_select_related = ("client",)
+    raw_id_fields = ("client",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = ("case_number", "client__first_name", "client__last_name")
-    list_filter = ("status", "incident_type", "created_at")
+    list_filter = ("status", "incident_type", CreatedRecencyFilter)
     inlines = [OtherPartyInline, TreatmentInline, DamageInline]
 
 
 @admin.register(OtherParty)
 class OtherPartyAdmin(admin.ModelAdmin):
-    list_display = ("__str__", "case", "role", "phone")
+    list_display = ("display_name", "case", "role", "phone")
+    list_select_related = ("case__client",)
+    raw_id_fields = ("case",)
     search_fields = ("first_name", "last_name", "company_name")
     list_filter = ("case__status",)
 
@@ -85,6 +295,7 @@ class OtherPartyAdmin(admin.ModelAdmin):
 @admin.register(InsuranceProvider)
 class InsuranceProviderAdmin(admin.ModelAdmin):
     list_display = ("company_name", "coverage_type", "policy_number", "claim_number", "adjuster_name")
+    raw_id_fields = ("insured_client", "insured_other_party")
     search_fields = ("company_name", "policy_number", "claim_number", "adjuster_name")
     list_filter = ("coverage_type",)
 
@@ -98,21 +309,29 @@ class MedicalFacilityAdmin(admin.ModelAdmin):
 
 @admin.register(MedicalProvider)
 class MedicalProviderAdmin(admin.ModelAdmin):
-    list_display = ("__str__", "specialty", "facility", "npi", "phone")
+    list_display = ("display_name", "specialty", "facility", "npi", "phone")
+    list_select_related = ("facility",)
+    raw_id_fields = ("facility",)
     search_fields = ("first_name", "last_name", "npi", "specialty")
-    list_filter = ("specialty", "facility")
+    list_filter = ("specialty", CachedFacilityFilter)
 
 
 @admin.register(Treatment)
 class TreatmentAdmin(admin.ModelAdmin):
     list_display = ("treatment_type", "case", "provider", "start_date", "billed_amount", "paid_amount")
+    list_select_related = ("case__client", "provider")
+    raw_id_fields = ("case", "provider")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = ("treatment_type", "diagnosis")
-    list_filter = ("start_date",)
+    list_filter = (StartDateRecencyFilter,)
 
 
 @admin.register(Damage)
 class DamageAdmin(admin.ModelAdmin):
     list_display = ("category", "case", "estimated_amount", "documented")
+    list_select_related = ("case__client",)
+    raw_id_fields = ("case",)
     search_fields = ("description",)
     list_filter = ("category", "documented")
 
@@ -132,17 +351,38 @@ class ClientCommunicationCitationInline(admin.TabularInline):
 
 
 @admin.register(ClientCommunication)
-class ClientCommunicationAdmin(admin.ModelAdmin):
-    list_display = ("__str__", "client", "case", "channel", "occurred_at", "parse_status")
-    search_fields = ("client__first_name", "client__last_name", "external_id", "summary")
-    list_filter = ("channel", "parse_status", "occurred_at")
+class ClientCommunicationAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    list_display = ("display_name", "client", "case", "channel", "occurred_at", "parse_status")
+    list_select_related = ("client", "case")
+    raw_id_fields = ("client", "case")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    search_fields = ("client__first_name", "client__last_name", "external_id")
+    full_text_search_fields = ("summary",)
+    list_filter = ("channel", "parse_status", OccurredRecencyFilter)
     inlines = [ClientCommunicationCitationInline]
 
+    def get_queryset(self, request):
+        # Render the row label from a DB-side Concat instead of __str__,
+        # which formats three fields per row in Python.
+        return super().get_queryset(request).annotate(
+            _display=Concat("channel", Value(" with "), "client__first_name", Value(" "), "client__last_name")
+        )
+
+    @admin.display(description="Communication", ordering="_display")
+    def display_name(self, obj):
+        return obj._display
+
 
 @admin.register(ClientCommunicationCitation)
-class ClientCommunicationCitationAdmin(admin.ModelAdmin):
+class ClientCommunicationCitationAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ("citation_key", "communication", "confidence_score", "turn_index")
-    search_fields = ("citation_key", "cited_text")
+    list_select_related = ("communication__client",)
+    raw_id_fields = ("communication",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    search_fields = ("citation_key",)
+    full_text_search_fields = ("cited_text",)
     list_filter = ("citation_key",)
     inlines = [CitationReferenceInline]
 
@@ -150,5 +390,9 @@ class ClientCommunicationCitationAdmin(admin.ModelAdmin):
 @admin.register(CitationReference)
 class CitationReferenceAdmin(admin.ModelAdmin):
     list_display = ("citation", "content_type", "object_id", "relationship_label")
+    list_select_related = ("citation__communication__client", "content_type")
+    raw_id_fields = ("citation", "content_type")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = ("object_id", "relationship_label")
-    list_filter = ("content_type",)
+    list_filter = (CachedContentTypeFilter,)
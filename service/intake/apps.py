@@ -5,3 +5,6 @@ class IntakeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "intake"
     verbose_name = "Intake"
+
+    def ready(self):
+        from . import signals  # noqa: F401 — register signal handlers
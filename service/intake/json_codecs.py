@@ -0,0 +1,27 @@
+"""
+orjson-backed codecs for Django JSONField.
+
+Django (de)serializes JSONField values through stdlib json.dumps/json.loads,
+passing a codec class via ``cls``. Overriding encode()/decode() routes the
+actual work through orjson's C encoder while keeping the stdlib-compatible
+class interface Django expects. The hot case is ClientCommunication.raw_transcript,
+a large turn array re-encoded on every save and re-decoded on every fetch.
+"""
+
+import json
+
+import orjson
+
+
+class ORJSONEncoder(json.JSONEncoder):
+    """Encode JSONField values with orjson; non-native types fall back to str()."""
+
+    def encode(self, o):
+        return orjson.dumps(o, default=str).decode()
+
+
+class ORJSONDecoder(json.JSONDecoder):
+    """Decode JSONField values with orjson."""
+
+    def decode(self, s, *args, **kwargs):
+        return orjson.loads(s)
@@ -0,0 +1,79 @@
+"""
+Backfill unparsed communications through the OpenAI Batch API.
+
+Collects ClientCommunication rows still in parse_status="pending", submits
+their transcripts as one batch job (50% cheaper, higher rate limits than the
+synchronous endpoint), then runs the normal parse/persist pipeline on the
+downloaded findings. Intended for nightly reprocessing; live intake keeps
+using the synchronous path.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from intake.models import ClientCommunication
+from intake.services.transcript_parser import TranscriptParserService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Parse pending client communications via the OpenAI Batch API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of communications to submit in this run.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=30.0,
+            help="Seconds between batch status polls (default: 30).",
+        )
+
+    def handle(self, *args, **options):
+        queryset = ClientCommunication.objects.filter(parse_status="pending").order_by(
+            "created_at"
+        )
+        if options["limit"]:
+            queryset = queryset[: options["limit"]]
+
+        communications = [c for c in queryset if c.raw_transcript]
+        if not communications:
+            self.stdout.write("No pending communications with transcripts found.")
+            return
+
+        self.stdout.write(f"Submitting {len(communications)} communication(s) as a batch...")
+
+        service = TranscriptParserService()
+        findings_by_id = service._call_llm_batch(
+            {str(comm.pk): comm.raw_transcript for comm in communications},
+            poll_interval=options["poll_interval"],
+        )
+
+        parsed = failed = 0
+        for comm in communications:
+            findings = findings_by_id.get(str(comm.pk))
+            if findings is None:
+                comm.parse_status = "failed"
+                comm.save(update_fields=["parse_status", "updated_at"])
+                failed += 1
+                continue
+            try:
+                result = service.parse_from_findings(findings, comm)
+                if comm.case:
+                    service.persist(comm.case, result, communication=comm)
+                parsed += 1
+            except Exception:
+                logger.exception("intake_backfill_batch: failed to persist %s", comm.pk)
+                comm.parse_status = "failed"
+                comm.save(update_fields=["parse_status", "updated_at"])
+                failed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Batch backfill complete: {parsed} parsed, {failed} failed.")
+        )
@@ -0,0 +1,86 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+REF_FIELD_BY_MODEL = {
+    "client": "ref_client",
+    "otherparty": "ref_other_party",
+    "medicalprovider": "ref_medical_provider",
+    "insuranceprovider": "ref_insurance_provider",
+}
+
+
+def backfill_concrete_refs(apps, schema_editor):
+    """Copy legacy (content_type, object_id) pairs into the concrete FK columns.
+
+    The legacy GenericForeignKey had no GenericRelation, so object_id may point
+    at a deleted row, and content_type had no limit_choices_to until 0007, so
+    rows may reference models outside the four mapped here. Neither kind can be
+    backfilled; they are deleted below so the exactly-one-ref CHECK can apply
+    (same clean-before-constrain approach as 0008's dedupe).
+    """
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    CitationReference = apps.get_model("intake", "CitationReference")
+
+    for ct in ContentType.objects.filter(app_label="intake", model__in=REF_FIELD_BY_MODEL):
+        field = REF_FIELD_BY_MODEL[ct.model]
+        target = apps.get_model("intake", ct.model)
+        valid_ids = {str(pk) for pk in target.objects.values_list("pk", flat=True)}
+        batch = []
+        for ref in CitationReference.objects.filter(content_type=ct, **{f"{field}__isnull": True}).iterator():
+            if str(ref.object_id) not in valid_ids:
+                continue  # dangling object_id — swept up with the orphans below
+            setattr(ref, f"{field}_id", ref.object_id)
+            batch.append(ref)
+            if len(batch) >= 1000:
+                CitationReference.objects.bulk_update(batch, [field])
+                batch = []
+        if batch:
+            CitationReference.objects.bulk_update(batch, [field])
+
+    # Anything still without a concrete ref points at a deleted object or an
+    # unmapped model and would fail the CHECK constraint.
+    CitationReference.objects.filter(
+        ref_client__isnull=True,
+        ref_other_party__isnull=True,
+        ref_medical_provider__isnull=True,
+        ref_insurance_provider__isnull=True,
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('intake', '0002_case_client_related_name_case_set'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='citationreference',
+            name='ref_client',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='citation_references', to='intake.client'),
+        ),
+        migrations.AddField(
+            model_name='citationreference',
+            name='ref_insurance_provider',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='citation_references', to='intake.insuranceprovider'),
+        ),
+        migrations.AddField(
+            model_name='citationreference',
+            name='ref_medical_provider',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='citation_references', to='intake.medicalprovider'),
+        ),
+        migrations.AddField(
+            model_name='citationreference',
+            name='ref_other_party',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='citation_references', to='intake.otherparty'),
+        ),
+        migrations.RunPython(backfill_concrete_refs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='citationreference',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('ref_client__isnull', False), ('ref_insurance_provider__isnull', True), ('ref_medical_provider__isnull', True), ('ref_other_party__isnull', True)), models.Q(('ref_client__isnull', True), ('ref_insurance_provider__isnull', True), ('ref_medical_provider__isnull', True), ('ref_other_party__isnull', False)), models.Q(('ref_client__isnull', True), ('ref_insurance_provider__isnull', True), ('ref_medical_provider__isnull', False), ('ref_other_party__isnull', True)), models.Q(('ref_client__isnull', True), ('ref_insurance_provider__isnull', False), ('ref_medical_provider__isnull', True), ('ref_other_party__isnull', True)), _connector='OR'), name='citationreference_exactly_one_ref'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Trigram GIN indexes let PostgreSQL serve the admin's substring search
+# (ILIKE '%term%') from an index instead of a sequential scan. They are
+# PostgreSQL-only, so this migration is a no-op on other backends (the
+# sqlite dev database).
+TRIGRAM_INDEXES = [
+    ("intake_client_name_trgm", "intake_client", ["last_name", "first_name"]),
+    ("intake_insurance_policy_trgm", "intake_insuranceprovider", ["policy_number"]),
+    ("intake_insurance_claim_trgm", "intake_insuranceprovider", ["claim_number"]),
+    ("intake_medicalprovider_npi_trgm", "intake_medicalprovider", ["npi"]),
+    ("intake_case_number_trgm", "intake_case", ["case_number"]),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, columns in TRIGRAM_INDEXES:
+        cols = ", ".join(f"{col} gin_trgm_ops" for col in columns)
+        schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({cols})")
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _columns in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0003_citationreference_ref_client_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
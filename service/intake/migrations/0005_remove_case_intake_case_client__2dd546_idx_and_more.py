@@ -0,0 +1,61 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0004_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='case',
+            name='intake_case_client__2dd546_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='clientcommunication',
+            name='intake_clie_client__300d03_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='clientcommunication',
+            name='intake_clie_case_id_a4f6de_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='damage',
+            name='intake_dama_case_id_2d52ee_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='treatment',
+            name='intake_trea_case_id_f33bed_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='treatment',
+            name='intake_trea_provide_770a6a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['client', '-created_at'], name='intake_case_client__bfc90d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientcommunication',
+            index=models.Index(fields=['client', '-occurred_at'], name='intake_clie_client__39ea37_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientcommunication',
+            index=models.Index(fields=['case', '-occurred_at'], name='intake_clie_case_id_42c883_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='damage',
+            index=models.Index(fields=['case', 'category'], name='intake_dama_case_id_466a2f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='treatment',
+            index=models.Index(fields=['case', '-start_date'], name='intake_trea_case_id_3079dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='treatment',
+            index=models.Index(fields=['provider', '-start_date'], name='intake_trea_provide_590068_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:21
+
+from django.db import migrations, models
+
+
+def normalize_object_ids(apps, schema_editor):
+    """Rewrite dashed UUID strings to the canonical hex form before the type change.
+
+    Only needed on backends that store UUIDField as text (sqlite); PostgreSQL
+    casts the old char(36) values with USING object_id::uuid.
+    """
+    if schema_editor.connection.vendor == "postgresql":
+        return
+    CitationReference = apps.get_model("intake", "CitationReference")
+    batch = []
+    for ref in CitationReference.objects.all().iterator():
+        normalized = ref.object_id.replace("-", "").lower()
+        if normalized != ref.object_id:
+            ref.object_id = normalized
+            batch.append(ref)
+        if len(batch) >= 1000:
+            CitationReference.objects.bulk_update(batch, ["object_id"])
+            batch = []
+    if batch:
+        CitationReference.objects.bulk_update(batch, ["object_id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0005_remove_case_intake_case_client__2dd546_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_object_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='citationreference',
+            name='object_id',
+            field=models.UUIDField(help_text='UUID of the referenced object'),
+        ),
+    ]
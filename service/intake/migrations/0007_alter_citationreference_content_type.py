@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('intake', '0006_alter_citationreference_object_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='citationreference',
+            name='content_type',
+            field=models.ForeignKey(limit_choices_to={'app_label': 'intake', 'model__in': ['client', 'otherparty', 'medicalprovider', 'insuranceprovider']}, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:24
+
+from django.db import migrations, models
+
+
+def dedupe_citations(apps, schema_editor):
+    """Drop repeat (communication, citation_key, turn_index) rows before the
+    unique constraint lands; earlier parses could write the same citation twice."""
+    ClientCommunicationCitation = apps.get_model("intake", "ClientCommunicationCitation")
+    seen = set()
+    duplicate_pks = []
+    for pk, comm_id, key, turn in (
+        ClientCommunicationCitation.objects.order_by("created_at")
+        .values_list("pk", "communication_id", "citation_key", "turn_index")
+        .iterator()
+    ):
+        row = (comm_id, key, turn)
+        if turn is not None and row in seen:
+            duplicate_pks.append(pk)
+        else:
+            seen.add(row)
+    if duplicate_pks:
+        ClientCommunicationCitation.objects.filter(pk__in=duplicate_pks).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0007_alter_citationreference_content_type'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_citations, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='clientcommunicationcitation',
+            constraint=models.UniqueConstraint(fields=('communication', 'citation_key', 'turn_index'), name='uniq_citation_per_comm_key_turn'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_citation_case(apps, schema_editor):
+    """Copy case_id from each communication onto its existing citations."""
+    ClientCommunication = apps.get_model("intake", "ClientCommunication")
+    ClientCommunicationCitation = apps.get_model("intake", "ClientCommunicationCitation")
+    for comm_id, case_id in (
+        ClientCommunication.objects.exclude(case__isnull=True)
+        .values_list("id", "case_id")
+        .iterator()
+    ):
+        ClientCommunicationCitation.objects.filter(communication_id=comm_id).update(case_id=case_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0008_clientcommunicationcitation_uniq_citation_per_comm_key_turn'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientcommunicationcitation',
+            name='case',
+            field=models.ForeignKey(blank=True, help_text='Denormalized from communication.case so case-scoped citation queries skip the join', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='citations', to='intake.case'),
+        ),
+        migrations.RunPython(backfill_citation_case, migrations.RunPython.noop),
+    ]
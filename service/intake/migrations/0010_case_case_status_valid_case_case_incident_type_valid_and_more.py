@@ -0,0 +1,44 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:26
+
+from django.db import migrations, models
+
+
+def normalize_incident_types(apps, schema_editor):
+    """Map blank incident_type to 'other' so the CHECK constraint can apply.
+
+    Earlier ingest() versions wrote incident_type="" when the LLM returned no
+    case type; "" is not in the allowed set.
+    """
+    Case = apps.get_model("intake", "Case")
+    Case.objects.filter(incident_type="").update(incident_type="other")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0009_clientcommunicationcitation_case'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_incident_types, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='case',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['open', 'settled', 'dropped', 'trial', 'closed'])), name='case_status_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='case',
+            constraint=models.CheckConstraint(condition=models.Q(('incident_type__in', ['auto', 'slip_fall', 'medical_malpractice', 'product_liability', 'workplace', 'other'])), name='case_incident_type_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='clientcommunication',
+            constraint=models.CheckConstraint(condition=models.Q(('channel__in', ['phone', 'in_person', 'email', 'text', 'portal'])), name='communication_channel_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='damage',
+            constraint=models.CheckConstraint(condition=models.Q(('category__in', ['medical', 'lost_wages', 'pain_suffering', 'property', 'future_medical', 'future_lost_wages', 'other'])), name='damage_category_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='insuranceprovider',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('insured_client__isnull', False), ('insured_other_party__isnull', True)), models.Q(('insured_client__isnull', True), ('insured_other_party__isnull', False)), _connector='OR'), name='insurance_exactly_one_insured'),
+        ),
+    ]
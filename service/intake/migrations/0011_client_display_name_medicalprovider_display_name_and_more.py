@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:27
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0010_case_case_status_valid_case_case_incident_type_valid_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='display_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.AddField(
+            model_name='medicalprovider',
+            name='display_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat(models.Value('Dr. '), 'first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=205)),
+        ),
+        migrations.AddField(
+            model_name='otherparty',
+            name='display_name',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(models.Q(('company_name', ''), _negated=True), then='company_name'), default=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name')), output_field=models.CharField(max_length=255)),
+        ),
+    ]
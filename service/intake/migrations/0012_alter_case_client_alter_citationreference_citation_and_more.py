@@ -0,0 +1,85 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('intake', '0011_client_display_name_medicalprovider_display_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='case',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='case_set', to='intake.client'),
+        ),
+        migrations.AlterField(
+            model_name='citationreference',
+            name='citation',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='references', to='intake.clientcommunicationcitation'),
+        ),
+        migrations.AlterField(
+            model_name='citationreference',
+            name='content_type',
+            field=models.ForeignKey(db_index=False, limit_choices_to={'app_label': 'intake', 'model__in': ['client', 'otherparty', 'medicalprovider', 'insuranceprovider']}, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype'),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='law_firm',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='clients', to='intake.lawfirm'),
+        ),
+        migrations.AlterField(
+            model_name='clientcommunication',
+            name='case',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='communications', to='intake.case'),
+        ),
+        migrations.AlterField(
+            model_name='clientcommunication',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='communications', to='intake.client'),
+        ),
+        migrations.AlterField(
+            model_name='clientcommunicationcitation',
+            name='communication',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='citations', to='intake.clientcommunication'),
+        ),
+        migrations.AlterField(
+            model_name='damage',
+            name='case',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='damages', to='intake.case'),
+        ),
+        migrations.AlterField(
+            model_name='insuranceprovider',
+            name='insured_client',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='insurance_providers', to='intake.client'),
+        ),
+        migrations.AlterField(
+            model_name='insuranceprovider',
+            name='insured_other_party',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='insurance_providers', to='intake.otherparty'),
+        ),
+        migrations.AlterField(
+            model_name='medicalprovider',
+            name='facility',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='providers', to='intake.medicalfacility'),
+        ),
+        migrations.AlterField(
+            model_name='otherparty',
+            name='case',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='other_parties', to='intake.case'),
+        ),
+        migrations.AlterField(
+            model_name='treatment',
+            name='case',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='treatments', to='intake.case'),
+        ),
+        migrations.AlterField(
+            model_name='treatment',
+            name='provider',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='treatments', to='intake.medicalprovider'),
+        ),
+    ]
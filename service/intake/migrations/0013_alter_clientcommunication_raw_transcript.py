@@ -0,0 +1,19 @@
+# Generated by Django 6.0.2 on 2026-08-28 20:58
+
+import intake.json_codecs
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0012_alter_case_client_alter_citationreference_citation_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='clientcommunication',
+            name='raw_transcript',
+            field=models.JSONField(blank=True, decoder=intake.json_codecs.ORJSONDecoder, default=list, encoder=intake.json_codecs.ORJSONEncoder, help_text='Array of transcript turn objects: [{speaker, text, timestamp}]'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 6.0.2 on 2026-08-28 21:10
+
+from django.db import migrations, models
+
+
+def _dedupe(model, key_fields, repoint=()):
+    """Keep the oldest row per key (as 0008 does for citations), repoint any
+    FKs at the duplicates onto the kept row, then delete the duplicates."""
+    seen = {}
+    duplicates = {}  # duplicate pk -> kept pk
+    for row in model.objects.order_by("created_at").values_list("pk", *key_fields).iterator():
+        pk, key = row[0], row[1:]
+        if None in key:
+            continue  # NULL keys are distinct under the unique constraint
+        if key in seen:
+            duplicates[pk] = seen[key]
+        else:
+            seen[key] = pk
+    if not duplicates:
+        return
+    for related, fk_field in repoint:
+        for dup_pk, kept_pk in duplicates.items():
+            related.objects.filter(**{fk_field: dup_pk}).update(**{fk_field: kept_pk})
+    model.objects.filter(pk__in=duplicates).delete()
+
+
+def dedupe_before_unique(apps, schema_editor):
+    """Nothing pre-series enforced these shapes, so collapse duplicates before
+    the unique constraints land. Facilities/providers/parties are deduped
+    before the rows that reference them so repointed FKs end up on kept rows."""
+    Damage = apps.get_model("intake", "Damage")
+    MedicalFacility = apps.get_model("intake", "MedicalFacility")
+    MedicalProvider = apps.get_model("intake", "MedicalProvider")
+    OtherParty = apps.get_model("intake", "OtherParty")
+    Treatment = apps.get_model("intake", "Treatment")
+    InsuranceProvider = apps.get_model("intake", "InsuranceProvider")
+    CitationReference = apps.get_model("intake", "CitationReference")
+
+    _dedupe(MedicalFacility, ("name",), repoint=[(MedicalProvider, "facility")])
+    _dedupe(
+        MedicalProvider,
+        ("first_name", "last_name"),
+        repoint=[(Treatment, "provider"), (CitationReference, "ref_medical_provider")],
+    )
+    _dedupe(Treatment, ("case_id", "provider_id"))
+    _dedupe(
+        OtherParty,
+        ("case_id", "first_name", "last_name"),
+        repoint=[
+            (InsuranceProvider, "insured_other_party"),
+            (CitationReference, "ref_other_party"),
+        ],
+    )
+    _dedupe(Damage, ("case_id", "category"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0013_alter_clientcommunication_raw_transcript'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_before_unique, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='damage',
+            constraint=models.UniqueConstraint(fields=('case', 'category'), name='uniq_damage_case_category'),
+        ),
+        migrations.AddConstraint(
+            model_name='medicalfacility',
+            constraint=models.UniqueConstraint(fields=('name',), name='uniq_medicalfacility_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='medicalprovider',
+            constraint=models.UniqueConstraint(fields=('first_name', 'last_name'), name='uniq_medicalprovider_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='otherparty',
+            constraint=models.UniqueConstraint(fields=('case', 'first_name', 'last_name'), name='uniq_otherparty'),
+        ),
+        migrations.AddConstraint(
+            model_name='treatment',
+            constraint=models.UniqueConstraint(fields=('case', 'provider'), name='uniq_treatment_case_provider'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-08-28 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intake', '0014_damage_uniq_damage_case_category_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['client', 'incident_date'], name='intake_case_client__63cc6a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['client', 'incident_type'], name='intake_case_client__a41035_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+# Trigram GIN index so _find_existing_case's incident_location icontains
+# fallback match can use an index scan instead of a sequential scan over the
+# client's cases. PostgreSQL-only, like 0004; a no-op on other backends (the
+# sqlite dev database).
+TRIGRAM_INDEXES = [
+    ("intake_case_location_trgm", "intake_case", ["incident_location"]),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, columns in TRIGRAM_INDEXES:
+        cols = ", ".join(f"{col} gin_trgm_ops" for col in columns)
+        schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({cols})")
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _columns in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0015_case_intake_case_client__63cc6a_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# GIN expression indexes backing the admin's FullTextSearchMixin, so the
+# SearchVector/SearchQuery filter is an index scan instead of computing
+# tsvectors across the whole table per search. The expressions (and the
+# 'english' config) must match the SearchVector annotation in admin.py
+# exactly for the planner to use them. PostgreSQL-only, like 0004 and 0016;
+# a no-op on other backends (the sqlite dev database).
+FTS_INDEXES = [
+    ("intake_communication_summary_fts", "intake_clientcommunication", "summary"),
+    ("intake_citation_cited_text_fts", "intake_clientcommunicationcitation", "cited_text"),
+]
+
+
+def create_fts_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in FTS_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin (to_tsvector('english', COALESCE({column}, '')))"
+        )
+
+
+def drop_fts_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in FTS_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0016_case_location_trigram_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_indexes, drop_fts_indexes),
+    ]
@@ -4,6 +4,9 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Concat
+
+from .json_codecs import ORJSONDecoder, ORJSONEncoder
 
 
 class LawFirm(models.Model):
@@ -30,7 +33,7 @@ class LawFirm(models.Model):
 
 class Client(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    law_firm = models.ForeignKey(LawFirm, on_delete=models.CASCADE, related_name="clients", db_index=True)
+    law_firm = models.ForeignKey(LawFirm, on_delete=models.CASCADE, related_name="clients", db_index=False)
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     date_of_birth = models.DateField(null=True, blank=True)
@@ -38,6 +41,11 @@ class Client(models.Model):
     email = models.EmailField(blank=True)
     address = models.TextField(blank=True)
     ssn_last_four = models.CharField(max_length=4, blank=True, help_text="Last 4 digits of SSN (PII)")
+    display_name = models.GeneratedField(
+        expression=Concat("first_name", models.Value(" "), "last_name"),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -54,24 +62,31 @@ class Client(models.Model):
         return f"{self.first_name} {self.last_name}"
 
 
+class CaseStatus(models.TextChoices):
+    OPEN = "open", "Open"
+    SETTLED = "settled", "Settled"
+    DROPPED = "dropped", "Dropped"
+    TRIAL = "trial", "Trial"
+    CLOSED = "closed", "Closed"
+
+
+class CaseIncidentType(models.TextChoices):
+    AUTO = "auto", "Auto Accident"
+    SLIP_FALL = "slip_fall", "Slip & Fall"
+    MEDICAL_MALPRACTICE = "medical_malpractice", "Medical Malpractice"
+    PRODUCT_LIABILITY = "product_liability", "Product Liability"
+    WORKPLACE = "workplace", "Workplace Injury"
+    OTHER = "other", "Other"
+
+
 class Case(models.Model):
-    class Status(models.TextChoices):
-        OPEN = "open", "Open"
-        SETTLED = "settled", "Settled"
-        DROPPED = "dropped", "Dropped"
-        TRIAL = "trial", "Trial"
-        CLOSED = "closed", "Closed"
-
-    class IncidentType(models.TextChoices):
-        AUTO = "auto", "Auto Accident"
-        SLIP_FALL = "slip_fall", "Slip & Fall"
-        MEDICAL_MALPRACTICE = "medical_malpractice", "Medical Malpractice"
-        PRODUCT_LIABILITY = "product_liability", "Product Liability"
-        WORKPLACE = "workplace", "Workplace Injury"
-        OTHER = "other", "Other"
+    # Module-level so Meta.constraints can reference the value lists;
+    # aliased here to keep the Case.Status / Case.IncidentType API.
+    Status = CaseStatus
+    IncidentType = CaseIncidentType
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="case_set", db_index=True)
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="case_set", db_index=False)
     case_number = models.CharField(max_length=100, unique=True, blank=True)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.OPEN)
     incident_type = models.CharField(max_length=30, choices=IncidentType.choices, default=IncidentType.OTHER)
@@ -92,7 +107,20 @@ class Case(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["incident_date"]),
             models.Index(fields=["created_at"]),
-            models.Index(fields=["client"]),
+            models.Index(fields=["client", "-created_at"]),
+            # Back the _find_existing_case match lookups during ingest
+            models.Index(fields=["client", "incident_date"]),
+            models.Index(fields=["client", "incident_type"]),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                name="case_status_valid",
+                condition=models.Q(status__in=CaseStatus.values),
+            ),
+            models.CheckConstraint(
+                name="case_incident_type_valid",
+                condition=models.Q(incident_type__in=CaseIncidentType.values),
+            ),
         ]
 
     def __str__(self):
@@ -101,7 +129,7 @@ class Case(models.Model):
 
 class OtherParty(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="other_parties", db_index=True)
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="other_parties", db_index=False)
     first_name = models.CharField(max_length=100, blank=True)
     last_name = models.CharField(max_length=100, blank=True)
     company_name = models.CharField(max_length=255, blank=True)
@@ -109,6 +137,14 @@ class OtherParty(models.Model):
     phone = models.CharField(max_length=50, blank=True)
     email = models.EmailField(blank=True)
     address = models.TextField(blank=True)
+    display_name = models.GeneratedField(
+        expression=models.Case(
+            models.When(~models.Q(company_name=""), then="company_name"),
+            default=Concat("first_name", models.Value(" "), "last_name"),
+        ),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -119,6 +155,13 @@ class OtherParty(models.Model):
         indexes = [
             models.Index(fields=["case"]),
         ]
+        constraints = [
+            # Matches the persist() de-duplication key so concurrent ingests
+            # can rely on INSERT ... ON CONFLICT instead of SELECT-then-INSERT
+            models.UniqueConstraint(
+                fields=["case", "first_name", "last_name"], name="uniq_otherparty"
+            ),
+        ]
 
     def __str__(self):
         if self.company_name:
@@ -142,7 +185,7 @@ class InsuranceProvider(models.Model):
         related_name="insurance_providers",
         null=True,
         blank=True,
-        db_index=True,
+        db_index=False,
     )
     insured_other_party = models.ForeignKey(
         OtherParty,
@@ -150,7 +193,7 @@ class InsuranceProvider(models.Model):
         related_name="insurance_providers",
         null=True,
         blank=True,
-        db_index=True,
+        db_index=False,
     )
     company_name = models.CharField(max_length=255)
     policy_number = models.CharField(max_length=100, blank=True)
@@ -171,6 +214,15 @@ class InsuranceProvider(models.Model):
             models.Index(fields=["insured_client"]),
             models.Index(fields=["insured_other_party"]),
         ]
+        constraints = [
+            models.CheckConstraint(
+                name="insurance_exactly_one_insured",
+                condition=(
+                    models.Q(insured_client__isnull=False, insured_other_party__isnull=True)
+                    | models.Q(insured_client__isnull=True, insured_other_party__isnull=False)
+                ),
+            ),
+        ]
 
     def clean(self):
         if bool(self.insured_client_id) == bool(self.insured_other_party_id):
@@ -202,6 +254,9 @@ class MedicalFacility(models.Model):
         indexes = [
             models.Index(fields=["name"]),
         ]
+        constraints = [
+            models.UniqueConstraint(fields=["name"], name="uniq_medicalfacility_name"),
+        ]
 
     def __str__(self):
         return self.name
@@ -210,7 +265,7 @@ class MedicalFacility(models.Model):
 class MedicalProvider(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     facility = models.ForeignKey(
-        MedicalFacility, on_delete=models.SET_NULL, related_name="providers", null=True, blank=True, db_index=True
+        MedicalFacility, on_delete=models.SET_NULL, related_name="providers", null=True, blank=True, db_index=False
     )
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
@@ -218,6 +273,11 @@ class MedicalProvider(models.Model):
     npi = models.CharField(max_length=20, blank=True, help_text="National Provider Identifier")
     phone = models.CharField(max_length=50, blank=True)
     email = models.EmailField(blank=True)
+    display_name = models.GeneratedField(
+        expression=Concat(models.Value("Dr. "), "first_name", models.Value(" "), "last_name"),
+        output_field=models.CharField(max_length=205),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -229,6 +289,11 @@ class MedicalProvider(models.Model):
             models.Index(fields=["facility"]),
             models.Index(fields=["last_name", "first_name"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["first_name", "last_name"], name="uniq_medicalprovider_name"
+            ),
+        ]
 
     def __str__(self):
         return f"Dr. {self.first_name} {self.last_name}"
@@ -236,9 +301,9 @@ class MedicalProvider(models.Model):
 
 class Treatment(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="treatments", db_index=True)
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="treatments", db_index=False)
     provider = models.ForeignKey(
-        MedicalProvider, on_delete=models.SET_NULL, related_name="treatments", null=True, blank=True, db_index=True
+        MedicalProvider, on_delete=models.SET_NULL, related_name="treatments", null=True, blank=True, db_index=False
     )
     treatment_type = models.CharField(max_length=255, blank=True, help_text="e.g., ER visit, MRI, physical therapy")
     start_date = models.DateField(null=True, blank=True)
@@ -256,27 +321,37 @@ class Treatment(models.Model):
         verbose_name_plural = "Treatments"
         ordering = ["-start_date"]
         indexes = [
-            models.Index(fields=["case"]),
-            models.Index(fields=["provider"]),
+            models.Index(fields=["case", "-start_date"]),
+            models.Index(fields=["provider", "-start_date"]),
             models.Index(fields=["start_date"]),
         ]
+        constraints = [
+            # NULL providers are exempt (SQL NULL never equals NULL), so manual
+            # treatment rows without a provider are unaffected
+            models.UniqueConstraint(
+                fields=["case", "provider"], name="uniq_treatment_case_provider"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.treatment_type or 'Treatment'} — {self.case}"
 
 
+class DamageCategory(models.TextChoices):
+    MEDICAL = "medical", "Medical Expenses"
+    LOST_WAGES = "lost_wages", "Lost Wages"
+    PAIN_SUFFERING = "pain_suffering", "Pain & Suffering"
+    PROPERTY = "property", "Property Damage"
+    FUTURE_MEDICAL = "future_medical", "Future Medical Expenses"
+    FUTURE_LOST_WAGES = "future_lost_wages", "Future Lost Wages"
+    OTHER = "other", "Other"
+
+
 class Damage(models.Model):
-    class DamageCategory(models.TextChoices):
-        MEDICAL = "medical", "Medical Expenses"
-        LOST_WAGES = "lost_wages", "Lost Wages"
-        PAIN_SUFFERING = "pain_suffering", "Pain & Suffering"
-        PROPERTY = "property", "Property Damage"
-        FUTURE_MEDICAL = "future_medical", "Future Medical Expenses"
-        FUTURE_LOST_WAGES = "future_lost_wages", "Future Lost Wages"
-        OTHER = "other", "Other"
+    DamageCategory = DamageCategory
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="damages", db_index=True)
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="damages", db_index=False)
     category = models.CharField(max_length=30, choices=DamageCategory.choices, default=DamageCategory.OTHER)
     description = models.TextField(blank=True)
     estimated_amount = models.DecimalField(max_digits=14, decimal_places=2, null=True, blank=True)
@@ -290,26 +365,36 @@ class Damage(models.Model):
         verbose_name_plural = "Damages"
         ordering = ["category"]
         indexes = [
-            models.Index(fields=["case"]),
+            models.Index(fields=["case", "category"]),
             models.Index(fields=["category"]),
         ]
+        constraints = [
+            models.CheckConstraint(
+                name="damage_category_valid",
+                condition=models.Q(category__in=DamageCategory.values),
+            ),
+            models.UniqueConstraint(fields=["case", "category"], name="uniq_damage_case_category"),
+        ]
 
     def __str__(self):
         return f"{self.get_category_display()} — {self.case}"
 
 
+class CommunicationChannel(models.TextChoices):
+    PHONE = "phone", "Phone Call"
+    IN_PERSON = "in_person", "In Person"
+    EMAIL = "email", "Email"
+    TEXT = "text", "Text Message"
+    PORTAL = "portal", "Client Portal"
+
+
 class ClientCommunication(models.Model):
-    class ChannelType(models.TextChoices):
-        PHONE = "phone", "Phone Call"
-        IN_PERSON = "in_person", "In Person"
-        EMAIL = "email", "Email"
-        TEXT = "text", "Text Message"
-        PORTAL = "portal", "Client Portal"
+    ChannelType = CommunicationChannel
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="communications", db_index=True)
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name="communications", db_index=False)
     case = models.ForeignKey(
-        Case, on_delete=models.SET_NULL, related_name="communications", null=True, blank=True, db_index=True
+        Case, on_delete=models.SET_NULL, related_name="communications", null=True, blank=True, db_index=False
     )
     channel = models.CharField(max_length=20, choices=ChannelType.choices, default=ChannelType.PHONE)
     occurred_at = models.DateTimeField(null=True, blank=True)
@@ -318,6 +403,8 @@ class ClientCommunication(models.Model):
     raw_transcript = models.JSONField(
         default=list,
         blank=True,
+        encoder=ORJSONEncoder,
+        decoder=ORJSONDecoder,
         help_text="Array of transcript turn objects: [{speaker, text, timestamp}]",
     )
     parse_status = models.CharField(
@@ -336,8 +423,14 @@ class ClientCommunication(models.Model):
         indexes = [
             models.Index(fields=["occurred_at"]),
             models.Index(fields=["created_at"]),
-            models.Index(fields=["client"]),
-            models.Index(fields=["case"]),
+            models.Index(fields=["client", "-occurred_at"]),
+            models.Index(fields=["case", "-occurred_at"]),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                name="communication_channel_valid",
+                condition=models.Q(channel__in=CommunicationChannel.values),
+            ),
         ]
 
     def __str__(self):
@@ -347,7 +440,16 @@ class ClientCommunication(models.Model):
 class ClientCommunicationCitation(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     communication = models.ForeignKey(
-        ClientCommunication, on_delete=models.CASCADE, related_name="citations", db_index=True
+        ClientCommunication, on_delete=models.CASCADE, related_name="citations", db_index=False
+    )
+    case = models.ForeignKey(
+        Case,
+        on_delete=models.SET_NULL,
+        related_name="citations",
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Denormalized from communication.case so case-scoped citation queries skip the join",
     )
     citation_key = models.CharField(max_length=100, help_text="Semantic key, e.g. 'incident_date', 'at_fault_party'")
     cited_text = models.TextField(help_text="The verbatim excerpt from the transcript supporting this citation")
@@ -365,22 +467,69 @@ class ClientCommunicationCitation(models.Model):
             models.Index(fields=["communication"]),
             models.Index(fields=["citation_key", "confidence_score"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["communication", "citation_key", "turn_index"],
+                name="uniq_citation_per_comm_key_turn",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.citation_key} ({self.confidence_score:.2f}) — {self.communication}"
 
 
 class CitationReference(models.Model):
-    """Polymorphic link from a citation to a Client, OtherParty, MedicalProvider, or InsuranceProvider."""
+    """Polymorphic link from a citation to a Client, OtherParty, MedicalProvider, or InsuranceProvider.
+
+    The target set is closed, so each allowed model gets its own nullable FK
+    (exactly one is set, enforced by a CHECK constraint). Resolving a reference
+    is then a plain JOIN with no django_content_type hop. The legacy
+    content_type/object_id pair is kept populated during the migration window.
+    """
 
     ALLOWED_CONTENT_TYPES = ["client", "otherparty", "medicalprovider", "insuranceprovider"]
 
+    # Maps ContentType.model → the concrete FK field carrying the reference.
+    REF_FIELD_BY_MODEL = {
+        "client": "ref_client",
+        "otherparty": "ref_other_party",
+        "medicalprovider": "ref_medical_provider",
+        "insuranceprovider": "ref_insurance_provider",
+    }
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     citation = models.ForeignKey(
-        ClientCommunicationCitation, on_delete=models.CASCADE, related_name="references", db_index=True
+        ClientCommunicationCitation, on_delete=models.CASCADE, related_name="references", db_index=False
+    )
+    ref_client = models.ForeignKey(
+        Client, on_delete=models.CASCADE, related_name="citation_references", null=True, blank=True, db_index=True
+    )
+    ref_other_party = models.ForeignKey(
+        OtherParty, on_delete=models.CASCADE, related_name="citation_references", null=True, blank=True, db_index=True
+    )
+    ref_medical_provider = models.ForeignKey(
+        MedicalProvider,
+        on_delete=models.CASCADE,
+        related_name="citation_references",
+        null=True,
+        blank=True,
+        db_index=True,
     )
-    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, db_index=True)
-    object_id = models.CharField(max_length=36, help_text="UUID of the referenced object")
+    ref_insurance_provider = models.ForeignKey(
+        InsuranceProvider,
+        on_delete=models.CASCADE,
+        related_name="citation_references",
+        null=True,
+        blank=True,
+        db_index=True,
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        db_index=False,
+        limit_choices_to={"app_label": "intake", "model__in": ALLOWED_CONTENT_TYPES},
+    )
+    object_id = models.UUIDField(help_text="UUID of the referenced object")
     referenced_object = GenericForeignKey("content_type", "object_id")
     relationship_label = models.CharField(
         max_length=100, blank=True, help_text="Human label for this reference, e.g. 'treating physician'"
@@ -396,6 +545,53 @@ class CitationReference(models.Model):
             models.Index(fields=["citation"]),
             models.Index(fields=["content_type", "object_id"]),
         ]
+        constraints = [
+            models.CheckConstraint(
+                name="citationreference_exactly_one_ref",
+                condition=(
+                    models.Q(
+                        ref_client__isnull=False,
+                        ref_other_party__isnull=True,
+                        ref_medical_provider__isnull=True,
+                        ref_insurance_provider__isnull=True,
+                    )
+                    | models.Q(
+                        ref_client__isnull=True,
+                        ref_other_party__isnull=False,
+                        ref_medical_provider__isnull=True,
+                        ref_insurance_provider__isnull=True,
+                    )
+                    | models.Q(
+                        ref_client__isnull=True,
+                        ref_other_party__isnull=True,
+                        ref_medical_provider__isnull=False,
+                        ref_insurance_provider__isnull=True,
+                    )
+                    | models.Q(
+                        ref_client__isnull=True,
+                        ref_other_party__isnull=True,
+                        ref_medical_provider__isnull=True,
+                        ref_insurance_provider__isnull=False,
+                    )
+                ),
+            ),
+        ]
+
+    def clean(self):
+        if self.content_type_id and self.content_type.model not in self.ALLOWED_CONTENT_TYPES:
+            raise ValidationError(
+                f"content_type must be one of: {', '.join(self.ALLOWED_CONTENT_TYPES)}."
+            )
+
+    @property
+    def resolved_reference(self):
+        """Return the referenced object from the concrete FKs (no ContentType hop)."""
+        return (
+            self.ref_client
+            or self.ref_other_party
+            or self.ref_medical_provider
+            or self.ref_insurance_provider
+        )
 
     def __str__(self):
         return f"Ref({self.content_type}, {self.object_id}) ← {self.citation}"
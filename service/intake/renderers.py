@@ -0,0 +1,30 @@
+"""
+DRF renderers for the intake API.
+
+ORJSONRenderer replaces the stock JSONRenderer so responses are encoded by
+orjson in C. The hot cases here are ClientCommunication payloads carrying
+raw_transcript (a large JSON array re-encoded on every response) and the
+UUID/datetime/Decimal-heavy model serializers.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render response data with orjson.
+
+    orjson natively encodes dict/list subclasses (DRF's ReturnDict /
+    ReturnList), UUID, datetime and date; anything else (Decimal,
+    lazy strings) falls back to str(), matching the stock renderer's
+    string coercion for decimals.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=str)
@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from .models import (
@@ -19,36 +20,114 @@ from .models import (
 class LawFirmSerializer(serializers.ModelSerializer):
     class Meta:
         model = LawFirm
-        fields = "__all__"
+        fields = ("id", "name", "address", "phone", "email", "website", "created_at", "updated_at")
 
 
 class ClientSerializer(serializers.ModelSerializer):
     class Meta:
         model = Client
-        fields = "__all__"
+        fields = (
+            "id",
+            "law_firm",
+            "first_name",
+            "last_name",
+            "date_of_birth",
+            "phone",
+            "email",
+            "address",
+            "ssn_last_four",
+            "created_at",
+            "updated_at",
+        )
 
 
 class CaseSerializer(serializers.ModelSerializer):
     class Meta:
         model = Case
-        fields = "__all__"
+        fields = (
+            "id",
+            "client",
+            "case_number",
+            "status",
+            "incident_type",
+            "incident_date",
+            "incident_location",
+            "description",
+            "outcome_status",
+            "outcome_value",
+            "statute_of_limitations_date",
+            "created_at",
+            "updated_at",
+        )
+
+
+class CaseListSerializer(CaseSerializer):
+    """List rows omit the free-text columns (description, incident_location)."""
+
+    class Meta(CaseSerializer.Meta):
+        fields = (
+            "id",
+            "client",
+            "case_number",
+            "status",
+            "incident_type",
+            "incident_date",
+            "outcome_status",
+            "outcome_value",
+            "statute_of_limitations_date",
+            "created_at",
+            "updated_at",
+        )
 
 
 class OtherPartySerializer(serializers.ModelSerializer):
     class Meta:
         model = OtherParty
-        fields = "__all__"
+        fields = (
+            "id",
+            "case",
+            "first_name",
+            "last_name",
+            "company_name",
+            "role",
+            "phone",
+            "email",
+            "address",
+            "created_at",
+            "updated_at",
+        )
 
 
 class InsuranceProviderSerializer(serializers.ModelSerializer):
     class Meta:
         model = InsuranceProvider
-        fields = "__all__"
+        fields = (
+            "id",
+            "insured_client",
+            "insured_other_party",
+            "company_name",
+            "policy_number",
+            "claim_number",
+            "coverage_type",
+            "policy_limit",
+            "adjuster_name",
+            "adjuster_phone",
+            "adjuster_email",
+            "created_at",
+            "updated_at",
+        )
 
     def validate(self, data):
-        insured_client = data.get("insured_client") or getattr(self.instance, "insured_client", None)
-        insured_other_party = data.get("insured_other_party") or getattr(self.instance, "insured_other_party", None)
-        if bool(insured_client) == bool(insured_other_party):
+        # Cheap ID-level check; the DB CHECK constraint is the real enforcement.
+        if "insured_client" in data:
+            has_client = data["insured_client"] is not None
+        else:
+            has_client = self.instance is not None and self.instance.insured_client_id is not None
+        if "insured_other_party" in data:
+            has_other_party = data["insured_other_party"] is not None
+        else:
+            has_other_party = self.instance is not None and self.instance.insured_other_party_id is not None
+        if has_client == has_other_party:
             raise serializers.ValidationError(
                 "Exactly one of insured_client or insured_other_party must be set."
             )
@@ -58,25 +137,85 @@ class InsuranceProviderSerializer(serializers.ModelSerializer):
 class MedicalFacilitySerializer(serializers.ModelSerializer):
     class Meta:
         model = MedicalFacility
-        fields = "__all__"
+        fields = ("id", "name", "facility_type", "address", "phone", "fax", "npi", "created_at", "updated_at")
 
 
 class MedicalProviderSerializer(serializers.ModelSerializer):
     class Meta:
         model = MedicalProvider
-        fields = "__all__"
+        fields = (
+            "id",
+            "facility",
+            "first_name",
+            "last_name",
+            "specialty",
+            "npi",
+            "phone",
+            "email",
+            "created_at",
+            "updated_at",
+        )
 
 
 class TreatmentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Treatment
-        fields = "__all__"
+        fields = (
+            "id",
+            "case",
+            "provider",
+            "treatment_type",
+            "start_date",
+            "end_date",
+            "diagnosis",
+            "icd_codes",
+            "billed_amount",
+            "paid_amount",
+            "notes",
+            "created_at",
+            "updated_at",
+        )
+
+
+class TreatmentListSerializer(TreatmentSerializer):
+    """List rows omit diagnosis, icd_codes and notes."""
+
+    class Meta(TreatmentSerializer.Meta):
+        fields = (
+            "id",
+            "case",
+            "provider",
+            "treatment_type",
+            "start_date",
+            "end_date",
+            "billed_amount",
+            "paid_amount",
+            "created_at",
+            "updated_at",
+        )
 
 
 class DamageSerializer(serializers.ModelSerializer):
     class Meta:
         model = Damage
-        fields = "__all__"
+        fields = (
+            "id",
+            "case",
+            "category",
+            "description",
+            "estimated_amount",
+            "documented",
+            "notes",
+            "created_at",
+            "updated_at",
+        )
+
+
+class DamageListSerializer(DamageSerializer):
+    """List rows omit description and notes."""
+
+    class Meta(DamageSerializer.Meta):
+        fields = ("id", "case", "category", "estimated_amount", "documented", "created_at", "updated_at")
 
 
 class CitationReferenceSerializer(serializers.ModelSerializer):
@@ -84,27 +223,105 @@ class CitationReferenceSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CitationReference
-        fields = "__all__"
+        fields = (
+            "id",
+            "citation",
+            "ref_client",
+            "ref_other_party",
+            "ref_medical_provider",
+            "ref_insurance_provider",
+            "content_type",
+            "object_id",
+            "relationship_label",
+            "referenced_object_repr",
+            "created_at",
+            "updated_at",
+        )
 
     def get_referenced_object_repr(self, obj):
-        ref = obj.referenced_object
+        # Prefer the concrete FKs (single JOIN, no ContentType lookup); fall
+        # back to the legacy GenericForeignKey for rows not yet backfilled.
+        ref = obj.resolved_reference or obj.referenced_object
         if ref is None:
             return None
         return str(ref)
 
+    def validate(self, data):
+        # Cheap ID-level check; the exactly-one-ref DB CHECK constraint is the
+        # real enforcement. Effective value per field: incoming data, else the
+        # current instance (partial updates).
+        refs = {}
+        for field in CitationReference.REF_FIELD_BY_MODEL.values():
+            if field in data:
+                refs[field] = data[field]
+            elif self.instance is not None:
+                refs[field] = getattr(self.instance, field)
+            else:
+                refs[field] = None
+        set_fields = [field for field, value in refs.items() if value is not None]
+        if len(set_fields) > 1:
+            raise serializers.ValidationError(
+                f"Only one reference may be set, got: {', '.join(sorted(set_fields))}."
+            )
+        if not set_fields:
+            # Legacy clients send only the (content_type, object_id) pair; map
+            # it onto the matching concrete FK so the CHECK constraint holds.
+            content_type = data.get("content_type") or (
+                self.instance.content_type if self.instance else None
+            )
+            object_id = data.get("object_id") or (
+                self.instance.object_id if self.instance else None
+            )
+            field = (
+                CitationReference.REF_FIELD_BY_MODEL.get(content_type.model)
+                if content_type
+                else None
+            )
+            target = None
+            if field and object_id:
+                target = content_type.model_class()._default_manager.filter(pk=object_id).first()
+            if target is None:
+                raise serializers.ValidationError(
+                    "Set exactly one ref_* field, or a content_type/object_id "
+                    "pair referencing an existing object."
+                )
+            data[field] = target
+        return data
+
 
 class ClientCommunicationCitationSerializer(serializers.ModelSerializer):
     references = CitationReferenceSerializer(many=True, read_only=True)
 
     class Meta:
         model = ClientCommunicationCitation
-        fields = "__all__"
+        fields = (
+            "id",
+            "communication",
+            "citation_key",
+            "cited_text",
+            "turn_index",
+            "confidence_score",
+            "notes",
+            "references",
+            "created_at",
+            "updated_at",
+        )
 
 
 class ClientCommunicationCitationWriteSerializer(serializers.ModelSerializer):
     class Meta:
         model = ClientCommunicationCitation
-        fields = "__all__"
+        fields = (
+            "id",
+            "communication",
+            "citation_key",
+            "cited_text",
+            "turn_index",
+            "confidence_score",
+            "notes",
+            "created_at",
+            "updated_at",
+        )
 
 
 class ClientCommunicationSerializer(serializers.ModelSerializer):
@@ -112,10 +329,82 @@ class ClientCommunicationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ClientCommunication
-        fields = "__all__"
+        fields = (
+            "id",
+            "client",
+            "case",
+            "channel",
+            "occurred_at",
+            "duration_seconds",
+            "summary",
+            "raw_transcript",
+            "parse_status",
+            "external_id",
+            "citations",
+            "created_at",
+            "updated_at",
+        )
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Prefetch the nested citations → references tree in O(1) queries.
+
+        Without this, serializing N communications issues one query per
+        citation list plus one per reference list; callers should run their
+        base queryset through this hook before handing it to the serializer.
+        """
+        return queryset.prefetch_related(
+            Prefetch(
+                "citations",
+                queryset=ClientCommunicationCitation.objects.prefetch_related(
+                    Prefetch(
+                        "references",
+                        queryset=CitationReference.objects.select_related(
+                            "content_type",
+                            "ref_client",
+                            "ref_other_party",
+                            "ref_medical_provider",
+                            "ref_insurance_provider",
+                        ),
+                    )
+                ),
+            )
+        )
+
+
+class ClientCommunicationListSerializer(ClientCommunicationSerializer):
+    """List rows omit the heavyweight raw_transcript JSON and summary text."""
+
+    class Meta(ClientCommunicationSerializer.Meta):
+        fields = (
+            "id",
+            "client",
+            "case",
+            "channel",
+            "occurred_at",
+            "duration_seconds",
+            "parse_status",
+            "external_id",
+            "citations",
+            "created_at",
+            "updated_at",
+        )
 
 
 class ClientCommunicationWriteSerializer(serializers.ModelSerializer):
     class Meta:
         model = ClientCommunication
-        fields = "__all__"
+        fields = (
+            "id",
+            "client",
+            "case",
+            "channel",
+            "occurred_at",
+            "duration_seconds",
+            "summary",
+            "raw_transcript",
+            "parse_status",
+            "external_id",
+            "created_at",
+            "updated_at",
+        )
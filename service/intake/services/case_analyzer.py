@@ -3,6 +3,9 @@ case_analyzer.py — LLM-backed case analysis service.
 
 Public interface:
     analyze_case(case_id) -> dict
+    analyze_case_async(case_id) -> dict
+    analyze_cases(case_ids) -> list
+    analyze_cases_sync(case_ids) -> list
 
 Raises:
     Case.DoesNotExist   — propagated directly; caller maps to 404
@@ -11,19 +14,131 @@ Raises:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import io
+import itertools
 import logging
+import random
+import threading
 
+import httpx2
 import openai
+import orjson
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
 
 logger = logging.getLogger(__name__)
 
+# Model and prompt version are part of the analysis cache key so that
+# changing either invalidates previously cached reports.
+# The schema below pins the output shape, so the cheaper/faster mini model
+# is the default; pass model="gpt-5" for cases that warrant the large one.
+_ANALYSIS_MODEL = "gpt-5-mini"
+_PROMPT_VERSION = "v2"
+_ANALYSIS_CACHE_TIMEOUT = 60 * 60 * 24  # seconds
+
+# Stable routing key for OpenAI's server-side prompt caching. The system
+# prompt is a byte-identical prefix on every request, so cache hits get the
+# discounted input-token rate and faster prefill; keying all analyses
+# together maximizes prefix reuse.
+_PROMPT_CACHE_KEY = "intake-case-analyzer"
+
+# Per-section character budgets bounding the prompt size. tiktoken is not
+# a project dependency, so these use the ~4-chars-per-token rule of thumb;
+# structured sections (treatments, damages, insurance) get more room than
+# free text and transcripts, which trim first when a case is huge.
+_BUDGET_DESCRIPTION = 8_000
+_BUDGET_TREATMENTS = 24_000
+_BUDGET_DAMAGES = 12_000
+_BUDGET_INSURANCE = 12_000
+_BUDGET_COMMUNICATIONS = 16_000
+_BUDGET_CITATIONS = 12_000
+_TRUNCATION_MARKER = "\n...[truncated]"
+
+# Section headers, interned once instead of being rebuilt per call.
+_HDR_INCIDENT = "\nINCIDENT DESCRIPTION\n--------------------\n"
+_HDR_OTHER_PARTIES = "\nOTHER PARTIES\n-------------\n"
+_HDR_INSURANCE = "\nINSURANCE COVERAGE\n------------------\n"
+_HDR_TREATMENTS = "\nTREATMENTS & MEDICAL PROVIDERS\n-------------------------------\n"
+_HDR_DAMAGES = "\nDAMAGES\n-------\n"
+_HDR_COMMUNICATIONS = "\nCLIENT COMMUNICATIONS\n---------------------\n"
+_HDR_CITATIONS = "\nCITATIONS & EVIDENCE\n--------------------\n"
+
 
 class CaseAnalysisError(Exception):
     """Raised when the LLM call fails or returns unparseable output."""
 
 
+# ---------------------------------------------------------------------------
+# OpenAI client — lazy module-level singleton so the underlying httpx
+# connection pool (sockets, DNS cache, TLS session) is reused across calls
+# instead of being rebuilt per analysis.
+# ---------------------------------------------------------------------------
+
+_oai_client: openai.OpenAI | None = None
+_async_oai_client: openai.AsyncOpenAI | None = None
+_client_lock = threading.Lock()
+
+# Explicit transport configuration for the shared clients: a generous
+# keepalive pool so concurrent analyses reuse warm connections instead of
+# paying a TCP+TLS handshake each, and a tight connect timeout so a dead
+# network fails fast while slow completions still get two minutes.
+# (HTTP/2 multiplexing would go here too, but the h2 extra is not one of
+# this project's dependencies.)
+_HTTP_LIMITS = httpx2.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx2.Timeout(120.0, connect=10.0)
+
+
+def _api_key() -> str:
+    """Return the configured OpenAI API key.
+
+    Raises:
+        CaseAnalysisError: If OPENAPI_KEY is not configured.
+    """
+    api_key = getattr(settings, "OPENAPI_KEY", None)
+    if not api_key:
+        raise CaseAnalysisError(
+            "OPENAPI_KEY is not set. Add it to your .env file and ensure "
+            "load_dotenv() is called in settings.py."
+        )
+    return api_key
+
+
+def _get_client() -> openai.OpenAI:
+    """Return the shared OpenAI client, creating it on first use."""
+    global _oai_client
+    if _oai_client is None:
+        with _client_lock:
+            if _oai_client is None:
+                _oai_client = openai.OpenAI(
+                    api_key=_api_key(),
+                    http_client=httpx2.Client(
+                        limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+                    ),
+                    max_retries=2,
+                )
+    return _oai_client
+
+
+def _get_async_client() -> openai.AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _async_oai_client
+    if _async_oai_client is None:
+        with _client_lock:
+            if _async_oai_client is None:
+                _async_oai_client = openai.AsyncOpenAI(
+                    api_key=_api_key(),
+                    http_client=httpx2.AsyncClient(
+                        limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+                    ),
+                    max_retries=2,
+                )
+    return _async_oai_client
+
+
 # ---------------------------------------------------------------------------
 # System prompt — reproduced verbatim per specification; do not modify.
 # ---------------------------------------------------------------------------
@@ -85,10 +200,265 @@ Produce a JSON report with exactly these five sections:
 Return ONLY valid JSON. No markdown. No keys outside this schema."""
 
 
+# ---------------------------------------------------------------------------
+# Response schema — mirrors the five sections of the system prompt. Passed
+# as a structured-output response_format so the server constrains decoding
+# to this shape; required keys can no longer be missing from the response.
+# ---------------------------------------------------------------------------
+
+_REPORT_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": [
+        "incident_summary",
+        "damages_summary",
+        "liability_summary",
+        "insurance_summary",
+        "case_viability",
+    ],
+    "properties": {
+        "incident_summary": {"type": "string"},
+        "damages_summary": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["damage_type", "description", "amount", "provider"],
+                "properties": {
+                    "damage_type": {"type": "string"},
+                    "description": {"type": "string"},
+                    "amount": {"type": ["number", "null"]},
+                    "provider": {"type": ["string", "null"]},
+                },
+            },
+        },
+        "liability_summary": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["liable_party", "basis", "confidence", "caveats"],
+            "properties": {
+                "liable_party": {"type": "string"},
+                "basis": {"type": "string"},
+                "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+                "caveats": {"type": ["string", "null"]},
+            },
+        },
+        "insurance_summary": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": [
+                    "provider_name",
+                    "policy_type",
+                    "related_to",
+                    "claim_number",
+                    "notes",
+                ],
+                "properties": {
+                    "provider_name": {"type": "string"},
+                    "policy_type": {"type": "string"},
+                    "related_to": {
+                        "type": "string",
+                        "enum": ["client", "other_party", "unknown"],
+                    },
+                    "claim_number": {"type": ["string", "null"]},
+                    "notes": {"type": "string"},
+                },
+            },
+        },
+        "case_viability": {
+            "type": "object",
+            "additionalProperties": False,
+            "required": [
+                "recommendation",
+                "viability_score",
+                "reasoning",
+                "missing_info",
+                "red_flags",
+            ],
+            "properties": {
+                "recommendation": {
+                    "type": "string",
+                    "enum": ["strong_yes", "yes", "neutral", "no", "strong_no"],
+                },
+                "viability_score": {"type": "integer"},
+                "reasoning": {"type": "array", "items": {"type": "string"}},
+                "missing_info": {"type": "array", "items": {"type": "string"}},
+                "red_flags": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+    },
+}
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "case_analysis_report",
+        "strict": True,
+        "schema": _REPORT_SCHEMA,
+    },
+}
+
+
+def _compile_validator(schema: dict, path: str = "report"):
+    """Compile a schema node into a checker closure.
+
+    Covers the JSON Schema subset _REPORT_SCHEMA uses (object/array nesting,
+    type unions with null, required keys, enums). Compilation happens once
+    at import, so per-response validation is a tree of direct isinstance
+    checks with no schema interpretation — a defense-in-depth check on top
+    of the server-side strict schema, covering nested shapes the old
+    top-level set diff never saw.
+    """
+    declared = schema.get("type")
+    types = declared if isinstance(declared, list) else [declared]
+    allow_null = "null" in types
+    enum = schema.get("enum")
+
+    if "object" in types:
+        prop_checks = {
+            key: _compile_validator(sub, f"{path}.{key}")
+            for key, sub in schema.get("properties", {}).items()
+        }
+        required = tuple(schema.get("required", ()))
+
+        def check(value):
+            if value is None and allow_null:
+                return
+            if not isinstance(value, dict):
+                raise CaseAnalysisError(f"{path}: expected an object")
+            missing = [key for key in required if key not in value]
+            if missing:
+                raise CaseAnalysisError(f"{path}: missing required keys {missing}")
+            for key, sub_check in prop_checks.items():
+                if key in value:
+                    sub_check(value[key])
+
+        return check
+
+    if "array" in types:
+        item_check = (
+            _compile_validator(schema["items"], f"{path}[]")
+            if "items" in schema
+            else None
+        )
+
+        def check(value):
+            if value is None and allow_null:
+                return
+            if not isinstance(value, list):
+                raise CaseAnalysisError(f"{path}: expected an array")
+            if item_check is not None:
+                for item in value:
+                    item_check(item)
+
+        return check
+
+    scalar_types = {"string": str, "integer": int, "number": (int, float)}
+    py_types = tuple(
+        scalar_types[name] for name in types if name in scalar_types
+    )
+
+    def check(value):
+        if value is None:
+            if allow_null:
+                return
+            raise CaseAnalysisError(f"{path}: may not be null")
+        if enum is not None and value not in enum:
+            raise CaseAnalysisError(f"{path}: {value!r} not one of {enum}")
+        if py_types and (
+            not isinstance(value, py_types) or isinstance(value, bool)
+        ):
+            raise CaseAnalysisError(f"{path}: expected {'/'.join(types)}")
+
+    return check
+
+
+_validate_report = _compile_validator(_REPORT_SCHEMA)
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+class _NADict(dict):
+    """Row dict whose missing keys render as "N/A".
+
+    Rows are populated with only their non-empty values, so one C-level
+    format_map call replaces a Python _na() call per field.
+    """
+
+    def __missing__(self, key):
+        return "N/A"
+
+
+_TREATMENT_TMPL = (
+    "- Provider: {provider}\n"
+    "  Specialty: {specialty}\n"
+    "  Treatment Type: {treatment_type}\n"
+    "  Diagnosis: {diagnosis}\n"
+    "  Start Date: {start_date}\n"
+    "  End Date: {end_date}\n"
+    "  Billed Amount: {billed_amount}\n"
+    "  Paid Amount: {paid_amount}\n"
+    "  Notes: {notes}"
+)
+
+_OTHER_PARTY_TMPL = (
+    "- Name: {name}\n"
+    "  Role: {role}\n"
+    "  Phone: {phone}\n"
+    "  Email: {email}\n"
+    "  Address: {address}"
+)
+
+_INSURER_TMPL = (
+    "- Provider: {company_name}\n"
+    "  Coverage Type: {coverage_type}\n"
+    "  Related To: {related_to}\n"
+    "  Policy Number: {policy_number}\n"
+    "  Claim Number: {claim_number}\n"
+    "  Policy Limit: {policy_limit}\n"
+    "  Adjuster: {adjuster_name}"
+)
+
+_DAMAGE_TMPL = (
+    "- Category: {category}\n"
+    "  Description: {description}\n"
+    "  Estimated Amount: {estimated_amount}\n"
+    "  Documented: {documented}\n"
+    "  Notes: {notes}"
+)
+
+_COMMUNICATION_TMPL = (
+    "- Channel: {channel}\n"
+    "  Occurred At: {occurred_at}\n"
+    "  Summary: {summary}"
+)
+
+_CITATION_TMPL = (
+    "- Key: {citation_key}\n"
+    "  Cited Text: {cited_text}\n"
+    "  Turn Index: {turn_index}\n"
+    "  Confidence: {confidence:.2f}"
+)
+
+
+def _row(**fields) -> _NADict:
+    """Build a template row from only the non-empty fields."""
+    return _NADict(
+        (key, value) for key, value in fields.items() if value is not None and value != ""
+    )
+
+
+def _truncate(text: str, budget: int) -> str:
+    """Cap a rendered section at ``budget`` characters, marking the cut."""
+    if len(text) <= budget:
+        return text
+    return text[:budget] + _TRUNCATION_MARKER
+
+
 def _na(value) -> str:
     """Return the value as a string, or 'N/A' if falsy (None / empty string)."""
     if value is None or value == "":
@@ -100,165 +470,214 @@ def _build_user_message(case) -> str:
     """
     Assemble the structured user message from the fully-prefetched Case object.
 
-    Every section is always present; sections with no data write
-    "No data available." rather than being omitted.
+    Sections with no data are omitted entirely rather than rendering
+    "No data available." boilerplate — the system prompt already tolerates
+    missing data, and every boilerplate line is billed input tokens.
+
+    Each section is rendered as a single joined string so the assembly does
+    one buffer write per section instead of one list append per line.
     """
+    from intake.models import DamageCategory  # deferred to avoid circular import
+
+    na = _na  # local binding — called for nearly every field below
     client = case.client
     other_parties = list(case.other_parties.all())
-    treatments = list(case.treatments.all())
-    damages = list(case.damages.all())
+    # Treatments and damages are render-only: fetch just the referenced
+    # columns as dicts instead of hydrating full model instances.
+    treatments = list(
+        case.treatments.values(
+            "treatment_type",
+            "diagnosis",
+            "start_date",
+            "end_date",
+            "billed_amount",
+            "paid_amount",
+            "notes",
+            "provider_id",
+            "provider__first_name",
+            "provider__last_name",
+            "provider__specialty",
+            "provider__facility__name",
+        )
+    )
+    damages = list(
+        case.damages.values("category", "description", "estimated_amount", "documented", "notes")
+    )
     communications = list(case.communications.all())
 
-    # Collect insurance: client's own policies first, then per other-party
-    insurers: list[tuple[str, object]] = []
-    for ip in client.insurance_providers.all():
-        insurers.append(("client", ip))
-    for op in other_parties:
-        for ip in op.insurance_providers.all():
-            insurers.append(("other_party", ip))
-
-    lines: list[str] = []
+    out = io.StringIO()
+    write = out.write
 
     # ------------------------------------------------------------------
     # Header
     # ------------------------------------------------------------------
-    lines += [
-        "CASE ANALYSIS REQUEST",
-        "=====================",
-        f"Case ID: {case.id}",
-        f"Case Number: {_na(case.case_number)}",
-        f"Case Type: {case.get_incident_type_display()}",
-        f"Status: {case.get_status_display()}",
-        f"Incident Date: {_na(case.incident_date)}",
-        f"Incident Location: {_na(case.incident_location)}",
-        f"Statute of Limitations Date: {_na(case.statute_of_limitations_date)}",
-        "",
-    ]
+    write(
+        "\n".join(
+            (
+                "CASE ANALYSIS REQUEST",
+                "=====================",
+                f"Case ID: {case.id}",
+                f"Case Number: {na(case.case_number)}",
+                f"Case Type: {case.get_incident_type_display()}",
+                f"Status: {case.get_status_display()}",
+                f"Incident Date: {na(case.incident_date)}",
+                f"Incident Location: {na(case.incident_location)}",
+                f"Statute of Limitations Date: {na(case.statute_of_limitations_date)}",
+                "",
+            )
+        )
+    )
 
     # ------------------------------------------------------------------
     # Client
     # ------------------------------------------------------------------
-    lines += [
-        "CLIENT",
-        "------",
-        f"Name: {client.first_name} {client.last_name}".strip(),
-        f"Phone: {_na(client.phone)}",
-        f"Email: {_na(client.email)}",
-        f"Address: {_na(client.address)}",
-        f"Date of Birth: {_na(client.date_of_birth)}",
-        f"Law Firm: {_na(client.law_firm.name)}",
-        "",
-    ]
+    write(
+        "\n".join(
+            (
+                "\nCLIENT",
+                "------",
+                f"Name: {client.first_name} {client.last_name}".strip(),
+                f"Phone: {na(client.phone)}",
+                f"Email: {na(client.email)}",
+                f"Address: {na(client.address)}",
+                f"Date of Birth: {na(client.date_of_birth)}",
+                f"Law Firm: {na(client.law_firm.name)}",
+                "",
+            )
+        )
+    )
 
     # ------------------------------------------------------------------
     # Incident description
     # ------------------------------------------------------------------
-    lines += [
-        "INCIDENT DESCRIPTION",
-        "--------------------",
-        case.description.strip() if case.description.strip() else "No data available.",
-        "",
-    ]
+    description = case.description.strip()
+    if description:
+        write(_HDR_INCIDENT)
+        write(_truncate(description, _BUDGET_DESCRIPTION))
+        write("\n")
 
     # ------------------------------------------------------------------
     # Other parties
     # ------------------------------------------------------------------
-    lines += ["OTHER PARTIES", "-------------"]
     if other_parties:
-        for op in other_parties:
-            name = (
-                op.company_name
-                or f"{op.first_name} {op.last_name}".strip()
-                or "Unknown"
+        write(_HDR_OTHER_PARTIES)
+        write(
+            "\n".join(
+                _OTHER_PARTY_TMPL.format_map(
+                    _row(
+                        name=op.company_name
+                        or f"{op.first_name} {op.last_name}".strip()
+                        or "Unknown",
+                        role=op.role,
+                        phone=op.phone,
+                        email=op.email,
+                        address=op.address,
+                    )
+                )
+                for op in other_parties
             )
-            lines += [
-                f"- Name: {name}",
-                f"  Role: {_na(op.role)}",
-                f"  Phone: {_na(op.phone)}",
-                f"  Email: {_na(op.email)}",
-                f"  Address: {_na(op.address)}",
-            ]
-    else:
-        lines.append("No data available.")
-    lines.append("")
+        )
+        write("\n")
 
     # ------------------------------------------------------------------
     # Insurance coverage
     # ------------------------------------------------------------------
-    lines += ["INSURANCE COVERAGE", "------------------"]
-    if insurers:
-        for related_to, ip in insurers:
-            lines += [
-                f"- Provider: {ip.company_name}",
-                f"  Coverage Type: {ip.get_coverage_type_display()}",
-                f"  Related To: {related_to}",
-                f"  Policy Number: {_na(ip.policy_number)}",
-                f"  Claim Number: {_na(ip.claim_number)}",
-                f"  Policy Limit: {_na(ip.policy_limit)}",
-                f"  Adjuster: {_na(ip.adjuster_name)}",
-            ]
-    else:
-        lines.append("No data available.")
-    lines.append("")
+    # Client's own policies first, then per other-party — streamed through
+    # chain() so the (label, insurer) pairs are never materialized as a list.
+    insurers = itertools.chain(
+        (("client", ip) for ip in client.insurance_providers.all()),
+        (
+            ("other_party", ip)
+            for op in other_parties
+            for ip in op.insurance_providers.all()
+        ),
+    )
+    insurance_rows = "\n".join(
+        _INSURER_TMPL.format_map(
+            _row(
+                company_name=ip.company_name,
+                coverage_type=ip.get_coverage_type_display(),
+                related_to=related_to,
+                policy_number=ip.policy_number,
+                claim_number=ip.claim_number,
+                policy_limit=ip.policy_limit,
+                adjuster_name=ip.adjuster_name,
+            )
+        )
+        for related_to, ip in insurers
+    )
+    if insurance_rows:
+        write(_HDR_INSURANCE)
+        write(_truncate(insurance_rows, _BUDGET_INSURANCE))
+        write("\n")
 
     # ------------------------------------------------------------------
     # Treatments & medical providers
     # ------------------------------------------------------------------
-    lines += ["TREATMENTS & MEDICAL PROVIDERS", "-------------------------------"]
     if treatments:
+        write(_HDR_TREATMENTS)
+        rows = []
         for t in treatments:
-            if t.provider:
+            if t["provider_id"] is not None:
                 provider_name = (
-                    f"Dr. {t.provider.first_name} {t.provider.last_name}".strip()
+                    f"Dr. {t['provider__first_name']} {t['provider__last_name']}".strip()
                 )
-                if t.provider.facility:
-                    provider_name += f" ({t.provider.facility.name})"
-                specialty = _na(t.provider.specialty)
+                if t["provider__facility__name"]:
+                    provider_name += f" ({t['provider__facility__name']})"
+                specialty = na(t["provider__specialty"])
             else:
                 provider_name = "Unknown provider"
                 specialty = "N/A"
-            lines += [
-                f"- Provider: {provider_name}",
-                f"  Specialty: {specialty}",
-                f"  Treatment Type: {_na(t.treatment_type)}",
-                f"  Diagnosis: {_na(t.diagnosis)}",
-                f"  Start Date: {_na(t.start_date)}",
-                f"  End Date: {_na(t.end_date)}",
-                f"  Billed Amount: {_na(t.billed_amount)}",
-                f"  Paid Amount: {_na(t.paid_amount)}",
-                f"  Notes: {_na(t.notes)}",
-            ]
-    else:
-        lines.append("No data available.")
-    lines.append("")
+            row = _NADict(
+                (k, v) for k, v in t.items() if v is not None and v != ""
+            )
+            row["provider"] = provider_name
+            row["specialty"] = specialty
+            rows.append(_TREATMENT_TMPL.format_map(row))
+        write(_truncate("\n".join(rows), _BUDGET_TREATMENTS))
+        write("\n")
 
     # ------------------------------------------------------------------
     # Damages
     # ------------------------------------------------------------------
-    lines += ["DAMAGES", "-------"]
     if damages:
-        for d in damages:
-            lines += [
-                f"- Category: {d.get_category_display()}",
-                f"  Description: {_na(d.description)}",
-                f"  Estimated Amount: {_na(d.estimated_amount)}",
-                f"  Documented: {d.documented}",
-                f"  Notes: {_na(d.notes)}",
-            ]
-    else:
-        lines.append("No data available.")
-    lines.append("")
+        write(_HDR_DAMAGES)
+        category_labels = dict(DamageCategory.choices)
+        write(
+            _truncate(
+                "\n".join(
+                    _DAMAGE_TMPL.format_map(
+                        _row(
+                            category=category_labels.get(d["category"], d["category"]),
+                            description=d["description"],
+                            estimated_amount=d["estimated_amount"],
+                            # documented is a bool; False must still print
+                            documented=str(d["documented"]),
+                            notes=d["notes"],
+                        )
+                    )
+                    for d in damages
+                ),
+                _BUDGET_DAMAGES,
+            )
+        )
+        write("\n")
 
     # ------------------------------------------------------------------
     # Client communications (up to 10 transcript turns per communication)
     # ------------------------------------------------------------------
-    lines += ["CLIENT COMMUNICATIONS", "---------------------"]
     if communications:
+        write(_HDR_COMMUNICATIONS)
+        rows = []
         for comm in communications:
-            lines += [
-                f"- Channel: {comm.get_channel_display()}",
-                f"  Occurred At: {_na(comm.occurred_at)}",
-                f"  Summary: {_na(comm.summary)}",
+            parts = [
+                _COMMUNICATION_TMPL.format_map(
+                    _row(
+                        channel=comm.get_channel_display(),
+                        occurred_at=comm.occurred_at,
+                        summary=comm.summary,
+                    )
+                )
             ]
             turns = (
                 comm.raw_transcript[:10]
@@ -266,63 +685,80 @@ def _build_user_message(case) -> str:
                 else []
             )
             if turns:
-                lines.append("  Transcript (first 10 turns):")
-                for turn in turns:
-                    speaker = turn.get("speaker", "Unknown")
-                    text = turn.get("text", "")
-                    lines.append(f"    [{speaker}]: {text}")
-    else:
-        lines.append("No data available.")
-    lines.append("")
+                parts.append("  Transcript (first 10 turns):")
+                parts.extend(
+                    f"    [{turn.get('speaker', 'Unknown')}]: {turn.get('text', '')}"
+                    for turn in turns
+                )
+            rows.append("\n".join(parts))
+        write(_truncate("\n".join(rows), _BUDGET_COMMUNICATIONS))
+        write("\n")
 
     # ------------------------------------------------------------------
     # Citations & evidence
     # ------------------------------------------------------------------
-    lines += ["CITATIONS & EVIDENCE", "--------------------"]
     citations = [cit for comm in communications for cit in comm.citations.all()]
     if citations:
+        write(_HDR_CITATIONS)
+        rows = []
         for cit in citations:
-            lines += [
-                f"- Key: {cit.citation_key}",
-                f"  Cited Text: {_na(cit.cited_text)}",
-                f"  Turn Index: {_na(cit.turn_index)}",
-                f"  Confidence: {cit.confidence_score:.2f}",
-            ]
+            row = _row(
+                citation_key=cit.citation_key,
+                cited_text=cit.cited_text,
+                turn_index=cit.turn_index,
+            )
+            row["confidence"] = cit.confidence_score
+            rendered = _CITATION_TMPL.format_map(row)
             if cit.notes:
-                lines.append(f"  Notes: {cit.notes}")
-    else:
-        lines.append("No data available.")
+                rendered += f"\n  Notes: {cit.notes}"
+            rows.append(rendered)
+        write(_truncate("\n".join(rows), _BUDGET_CITATIONS))
 
-    return "\n".join(lines)
+    return out.getvalue()
 
 
 # ---------------------------------------------------------------------------
 # Public interface
 # ---------------------------------------------------------------------------
 
-def analyze_case(case_id) -> dict:
+def _analysis_cache_key(user_message: str, model: str = _ANALYSIS_MODEL) -> str:
+    """Cache key for an analysis: hash of the rendered case data.
+
+    The digest covers the full user message, so any change to the underlying
+    case data produces a different key; model and prompt version are mixed in
+    so upgrades never serve stale reports.
     """
-    Fetches all relevant case data, calls the OpenAI API, and returns a
-    structured case analysis report.
+    digest = hashlib.blake2b(
+        user_message.encode(), digest_size=16, person=b"case-analyze"
+    ).hexdigest()
+    return f"case-analyze:{_PROMPT_VERSION}:{model}:{digest}"
 
-    NOTE: The contract specifies ``case_id: int`` but Case.id is a UUID field.
-    The parameter accepts any value Django can use as a primary-key lookup
-    (str UUID, uuid.UUID instance, etc.).
 
-    Args:
-        case_id: Primary key of the Case record to analyze.
+def _read_alias() -> str:
+    """Database alias for analysis reads.
 
-    Returns:
-        A dict matching the five-section schema defined in the system prompt.
+    Analysis is a pure read that tolerates replication lag, so it goes to
+    the "replica" alias whenever one is configured and quietly falls back
+    to the primary otherwise. The related managers on the fetched instance
+    inherit the alias, so the prefetches follow it too.
+    """
+    return "replica" if "replica" in settings.DATABASES else "default"
 
-    Raises:
-        Case.DoesNotExist: If no case with this ID exists.
-        CaseAnalysisError: If the LLM call fails or returns unparseable output.
+
+def analysis_queryset():
+    """
+    Case queryset with every relation the message builder reads preloaded.
+
+    Views that fetch a Case themselves (case_summary, CaseViewSet.analyze)
+    use this so the instance they hand to analyze_case() carries the same
+    prefetches and the analyzer never re-queries.
     """
-    from intake.models import Case  # deferred to avoid circular import
+    # Deferred to avoid circular import
+    from intake.models import Case, ClientCommunication, ClientCommunicationCitation
 
-    case = (
-        Case.objects.select_related(
+    return (
+        Case.objects.using(_read_alias())
+        .select_related(
             "client",
             "client__law_firm",
         )
@@ -330,46 +766,93 @@ def analyze_case(case_id) -> dict:
             "other_parties",
             "other_parties__insurance_providers",
             "client__insurance_providers",
-            "treatments",
-            "treatments__provider",
-            "treatments__provider__facility",
-            "damages",
-            # "communications",
-            "communications__citations",
+            # treatments and damages are fetched as .values() rows inside
+            # _build_user_message, so prefetching instances here would be
+            # wasted work.
+            Prefetch(
+                "communications",
+                queryset=ClientCommunication.objects.order_by(
+                    "occurred_at"
+                ).prefetch_related(
+                    Prefetch(
+                        "citations",
+                        queryset=ClientCommunicationCitation.objects.only(
+                            "communication",
+                            "citation_key",
+                            "cited_text",
+                            "turn_index",
+                            "confidence_score",
+                            "notes",
+                        ),
+                    )
+                ),
+            ),
         )
-        .get(pk=case_id)
     )
 
-    user_message = _build_user_message(case)
 
-    api_key = getattr(settings, "OPENAPI_KEY", None)
-    if not api_key:
-        raise CaseAnalysisError(
-            "OPENAPI_KEY is not set. Add it to your .env file and ensure "
-            "load_dotenv() is called in settings.py."
-        )
+def _fetch_case(case_id):
+    """
+    Fetch the Case with every relation the message builder reads.
 
-    oai_client = openai.OpenAI(api_key=api_key)
+    Accepts an already-fetched Case instance and returns it untouched, so
+    callers holding one (from analysis_queryset()) don't pay a duplicate
+    SELECT cascade.
+    """
+    from intake.models import Case
 
-    try:
-        response = oai_client.chat.completions.create(
-            model="gpt-5",
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": user_message},
-            ],
-        )
-    except openai.OpenAIError as exc:
-        logger.error(
-            "OpenAI API call failed in analyze_case (case %s): %s", case_id, exc
+    if isinstance(case_id, Case):
+        return case_id
+    return analysis_queryset().get(pk=case_id)
+
+
+def _collect_stream(stream) -> str:
+    """Assemble a streamed completion into the full content string.
+
+    Receiving with stream=True overlaps network transfer with generation,
+    so the last token arrives (and parsing can start) as soon as the model
+    finishes instead of after an extra full-payload round-trip.
+    """
+    parts: list[str] = []
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+    return "".join(parts)
+
+
+async def _collect_stream_async(stream) -> str:
+    """Async counterpart of :func:`_collect_stream`."""
+    parts: list[str] = []
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+    return "".join(parts)
+
+
+def _log_prompt_cache(response, case_id) -> None:
+    """Record how many prompt tokens the API served from its prefix cache."""
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    if cached:
+        logger.debug(
+            "analyze_case: %s prompt tokens served from cache (case %s)",
+            cached,
+            case_id,
         )
-        raise CaseAnalysisError(f"LLM call failed: {exc}") from exc
 
-    raw = response.choices[0].message.content
+
+def _parse_and_validate(raw, case_id) -> dict:
+    """Parse the LLM response and enforce the five-section schema.
+
+    Raises:
+        CaseAnalysisError: On non-JSON output or missing required sections.
+    """
     try:
-        report = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        # orjson handles both str and bytes input and parses multi-KB
+        # payloads several times faster than stdlib json.
+        report = orjson.loads(raw)
+    except (orjson.JSONDecodeError, TypeError) as exc:
         logger.error(
             "analyze_case: could not parse LLM response as JSON (case %s). "
             "Raw content: %.500s",
@@ -378,26 +861,18 @@ def analyze_case(case_id) -> dict:
         )
         raise CaseAnalysisError(f"LLM returned non-JSON response: {exc}") from exc
 
-    # Validate required top-level sections
-    required = {
-        "incident_summary",
-        "damages_summary",
-        "liability_summary",
-        "insurance_summary",
-        "case_viability",
-    }
-    missing = required - report.keys()
-    if missing:
+    try:
+        _validate_report(report)
+    except CaseAnalysisError as exc:
         logger.error(
-            "analyze_case: LLM response missing required sections %s (case %s)",
-            missing,
+            "analyze_case: LLM response failed schema validation (case %s): %s",
             case_id,
+            exc,
         )
-        raise CaseAnalysisError(
-            f"LLM response missing required sections: {missing}"
-        )
+        raise
 
-    # Enforce viability_score is an integer 0–100
+    # Enforce viability_score lands in 0–100; strict response schemas do
+    # not support numeric ranges, so the clamp stays local.
     viability = report.get("case_viability", {})
     score = viability.get("viability_score")
     if not isinstance(score, int):
@@ -407,3 +882,200 @@ def analyze_case(case_id) -> dict:
             viability["viability_score"] = 0
 
     return report
+
+
+def analyze_case(
+    case_id,
+    force_refresh: bool = False,
+    model: str = _ANALYSIS_MODEL,
+    stream: bool = False,
+) -> dict:
+    """
+    Fetches all relevant case data, calls the OpenAI API, and returns a
+    structured case analysis report.
+
+    Results are cached against a hash of the rendered case data, so repeat
+    analyses of an unchanged case skip the LLM round-trip entirely.
+
+    NOTE: The contract specifies ``case_id: int`` but Case.id is a UUID field.
+    The parameter accepts any value Django can use as a primary-key lookup
+    (str UUID, uuid.UUID instance, etc.).
+
+    Args:
+        case_id: Primary key of the Case record to analyze, or a Case
+            instance already fetched via analysis_queryset().
+        force_refresh: Skip the cache and re-run the LLM analysis.
+        model: OpenAI model to use; defaults to the mini model.
+        stream: Receive the completion incrementally instead of as one
+            blocking payload; the parsed result is identical.
+
+    Returns:
+        A dict matching the five-section schema defined in the system prompt.
+
+    Raises:
+        Case.DoesNotExist: If no case with this ID exists.
+        CaseAnalysisError: If the LLM call fails or returns unparseable output.
+    """
+    case = _fetch_case(case_id)
+    case_id = case.pk
+    user_message = _build_user_message(case)
+
+    cache_key = _analysis_cache_key(user_message, model)
+    if not force_refresh:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug("analyze_case: cache hit for case %s", case_id)
+            return orjson.loads(cached)
+
+    oai_client = _get_client()
+
+    try:
+        response = oai_client.chat.completions.create(
+            model=model,
+            response_format=_RESPONSE_FORMAT,
+            stream=stream,
+            prompt_cache_key=_PROMPT_CACHE_KEY,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_message},
+            ],
+        )
+        if stream:
+            raw = _collect_stream(response)
+        else:
+            raw = response.choices[0].message.content
+            _log_prompt_cache(response, case_id)
+    except openai.OpenAIError as exc:
+        logger.error(
+            "OpenAI API call failed in analyze_case (case %s): %s", case_id, exc
+        )
+        raise CaseAnalysisError(f"LLM call failed: {exc}") from exc
+
+    report = _parse_and_validate(raw, case_id)
+
+    # Store orjson-encoded so cache backends hold compact bytes, not pickles.
+    cache.set(cache_key, orjson.dumps(report), timeout=_ANALYSIS_CACHE_TIMEOUT)
+
+    return report
+
+
+async def analyze_case_async(
+    case_id,
+    force_refresh: bool = False,
+    model: str = _ANALYSIS_MODEL,
+    stream: bool = False,
+) -> dict:
+    """
+    Async variant of :func:`analyze_case` backed by AsyncOpenAI.
+
+    The LLM round-trip dominates wall time (tens of seconds); awaiting it
+    instead of blocking lets one process keep many analyses in flight. DB
+    reads and cache access run through sync_to_async. Same contract,
+    caching and exceptions as the sync version.
+    """
+    case = await sync_to_async(_fetch_case)(case_id)
+    case_id = case.pk
+    user_message = await sync_to_async(_build_user_message)(case)
+
+    cache_key = _analysis_cache_key(user_message, model)
+    if not force_refresh:
+        cached = await sync_to_async(cache.get)(cache_key)
+        if cached is not None:
+            logger.debug("analyze_case_async: cache hit for case %s", case_id)
+            return orjson.loads(cached)
+
+    oai_client = _get_async_client()
+
+    try:
+        response = await oai_client.chat.completions.create(
+            model=model,
+            response_format=_RESPONSE_FORMAT,
+            stream=stream,
+            prompt_cache_key=_PROMPT_CACHE_KEY,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_message},
+            ],
+        )
+        if stream:
+            raw = await _collect_stream_async(response)
+        else:
+            raw = response.choices[0].message.content
+            _log_prompt_cache(response, case_id)
+    except openai.OpenAIError as exc:
+        logger.error(
+            "OpenAI API call failed in analyze_case_async (case %s): %s",
+            case_id,
+            exc,
+        )
+        raise CaseAnalysisError(f"LLM call failed: {exc}") from exc
+
+    report = _parse_and_validate(raw, case_id)
+
+    await sync_to_async(cache.set)(
+        cache_key, orjson.dumps(report), timeout=_ANALYSIS_CACHE_TIMEOUT
+    )
+
+    return report
+
+
+async def analyze_cases(
+    case_ids, concurrency: int = 10, max_attempts: int = 3
+) -> list:
+    """
+    Analyze many cases concurrently.
+
+    All analyses are scheduled at once behind a semaphore sized to stay
+    under the OpenAI rate limit, so N cases cost roughly one round-trip of
+    wall time instead of N. Transient failures are retried with jittered
+    exponential backoff.
+
+    Args:
+        case_ids: Iterable of Case primary keys.
+        concurrency: Maximum analyses in flight at once.
+        max_attempts: Attempts per case before giving up.
+
+    Returns:
+        A list aligned with ``case_ids``; each entry is either the report
+        dict or the exception that exhausted its retries.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _worker(case_id):
+        async with sem:
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await analyze_case_async(case_id)
+                except CaseAnalysisError as exc:
+                    if attempt == max_attempts:
+                        raise
+                    delay = min(2**attempt, 30) * (0.5 + random.random())
+                    logger.warning(
+                        "analyze_cases: case %s failed (attempt %d/%d), "
+                        "retrying in %.1fs: %s",
+                        case_id,
+                        attempt,
+                        max_attempts,
+                        delay,
+                        exc,
+                    )
+                    await asyncio.sleep(delay)
+
+    return await asyncio.gather(
+        *(_worker(case_id) for case_id in case_ids), return_exceptions=True
+    )
+
+
+def analyze_cases_sync(case_ids, concurrency: int = 20, max_attempts: int = 3) -> list:
+    """
+    Synchronous façade over :func:`analyze_cases`.
+
+    For callers without an event loop — management commands, task-queue
+    workers — this spins one up, fans the analyses out concurrently, and
+    returns when they all settle. Same return contract as analyze_cases.
+
+    Must not be called from async code; await analyze_cases directly there.
+    """
+    return asyncio.run(
+        analyze_cases(case_ids, concurrency=concurrency, max_attempts=max_attempts)
+    )
@@ -8,22 +8,109 @@ The public interface (parse / persist) is unchanged.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import io
 import logging
+import random
 import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import date
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import openai
+import orjson
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
 if TYPE_CHECKING:
     from intake.models import Case, ClientCommunication
 
 logger = logging.getLogger(__name__)
 
+# Shared AsyncOpenAI client for the concurrent ingest path — created once and
+# reused so concurrent aingest() calls share one connection pool.
+_async_oai_client: openai.AsyncOpenAI | None = None
+_client_lock = threading.Lock()
+
+
+# In-process LRU over the findings cache, keyed by the same content-hash key
+# as the Django cache. A fresh service instance per request means the
+# per-parse cache never survives the request; this layer does, and a hit
+# skips both the backend round-trip and its (de)serialization.
+_FINDINGS_MEMO_MAX = 128
+_findings_memo: OrderedDict[str, list[dict]] = OrderedDict()
+_findings_memo_lock = threading.Lock()
+
+
+def _findings_memo_get(key: str) -> list[dict] | None:
+    with _findings_memo_lock:
+        data = _findings_memo.get(key)
+        if data is not None:
+            _findings_memo.move_to_end(key)
+        return data
+
+
+def _findings_memo_set(key: str, data: list[dict]) -> None:
+    with _findings_memo_lock:
+        _findings_memo[key] = data
+        _findings_memo.move_to_end(key)
+        while len(_findings_memo) > _FINDINGS_MEMO_MAX:
+            _findings_memo.popitem(last=False)
+
+
+_allowed_ct_ids: frozenset[int] | None = None
+
+
+def _allowed_citation_ct_ids() -> frozenset[int]:
+    """
+    ContentType PKs allowed on CitationReference, resolved once per process.
+
+    Resolution is deferred to first use rather than import time — the app
+    registry (and, on a fresh deploy, the django_content_type table itself)
+    is not ready when this module loads. The PKs are immutable once migrated,
+    so a frozenset gives the citation loops an O(1) membership test without
+    re-reading ct.model per row.
+    """
+    global _allowed_ct_ids
+    if _allowed_ct_ids is None:
+        from django.contrib.contenttypes.models import ContentType
+
+        from intake.models import CitationReference
+
+        _allowed_ct_ids = frozenset(
+            ContentType.objects.filter(
+                app_label="intake", model__in=CitationReference.ALLOWED_CONTENT_TYPES
+            ).values_list("id", flat=True)
+        )
+    return _allowed_ct_ids
+
+
+def _get_async_client() -> openai.AsyncOpenAI:
+    """Return the module-level AsyncOpenAI client, creating it on first use."""
+    global _async_oai_client
+    if _async_oai_client is None:
+        with _client_lock:
+            if _async_oai_client is None:
+                api_key = getattr(settings, "OPENAPI_KEY", None)
+                if not api_key:
+                    raise RuntimeError(
+                        "OPENAPI_KEY is not set. Add it to your .env file and ensure "
+                        "load_dotenv() is called in settings.py."
+                    )
+                _async_oai_client = openai.AsyncOpenAI(api_key=api_key)
+    return _async_oai_client
+
 
 @dataclass
 class IntakeExtractionResult:
@@ -38,6 +125,33 @@ class IntakeExtractionResult:
     confidence_scores: dict[str, float] = field(default_factory=dict)
     raw_flags: list[str] = field(default_factory=list)
 
+    # Public keys per result shape — the underscore-prefixed citation-metadata
+    # keys are internal to persist() and never leave the API.
+    PUBLIC_PARTY_KEYS = ("first_name", "last_name", "company_name", "role")
+    PUBLIC_MEDICAL_KEYS = (
+        "first_name", "last_name", "facility_name", "specialty", "treatment_type", "diagnosis",
+    )
+    PUBLIC_DAMAGE_KEYS = ("category", "description", "estimated_amount")
+
+    @staticmethod
+    def _project(rows: list[dict], keys: tuple[str, ...]) -> list[dict]:
+        return [{k: r[k] for k in keys if k in r} for r in rows]
+
+    @cached_property
+    def public_other_parties(self) -> list[dict]:
+        """other_parties without citation metadata, built once per result."""
+        return self._project(self.other_parties, self.PUBLIC_PARTY_KEYS)
+
+    @cached_property
+    def public_medical_providers(self) -> list[dict]:
+        """medical_providers without citation metadata, built once per result."""
+        return self._project(self.medical_providers, self.PUBLIC_MEDICAL_KEYS)
+
+    @cached_property
+    def public_damages(self) -> list[dict]:
+        """damages without citation metadata, built once per result."""
+        return self._project(self.damages, self.PUBLIC_DAMAGE_KEYS)
+
 
 class TranscriptParserService:
     """
@@ -50,6 +164,11 @@ class TranscriptParserService:
         service.persist(case, result)
     """
 
+    def __init__(self, today: date | None = None):
+        # Bulk reprocess jobs can pin "today" once and share it across many
+        # communications instead of re-resolving the clock per result.
+        self._today = today
+
     # ------------------------------------------------------------------
     # Public interface
     # ------------------------------------------------------------------
@@ -67,11 +186,15 @@ class TranscriptParserService:
         """
         turns: list[dict] = communication.raw_transcript or []
 
-        incident_info = self._extract_incident_info(turns)
-        parties = self._extract_parties(turns)
-        medical = self._extract_medical(turns)
-        insurance = self._extract_insurance(turns)
-        damages = self._extract_damages(turns)
+        # One LLM call, one pass over the findings — each extractor consumes
+        # its (finding_type, field) bucket
+        findings = self._call_llm(turns)
+        buckets = self._bucket_findings(findings)
+        incident_info = self._extract_incident_info(turns, buckets=buckets)
+        parties = self._extract_parties(turns, buckets=buckets)
+        medical = self._extract_medical(turns, buckets=buckets)
+        insurance = self._extract_insurance(turns, buckets=buckets)
+        damages = self._extract_damages(turns, buckets=buckets)
 
         result = IntakeExtractionResult(
             incident_date=incident_info.get("incident_date"),
@@ -84,18 +207,49 @@ class TranscriptParserService:
             damages=damages,
             confidence_scores=incident_info.get("confidence_scores", {}),
         )
-        result.raw_flags = self._flag_risks(result)
+        result.raw_flags = self._flag_risks(result, findings)
 
-        # Update parse status on the communication record
+        # Update parse status on the communication record — a targeted
+        # QuerySet.update() is one round-trip with no signal machinery.
         communication.parse_status = "done"
-        communication.save(update_fields=["parse_status", "updated_at"])
+        communication.updated_at = timezone.now()
+        type(communication).objects.filter(pk=communication.pk).update(
+            parse_status="done", updated_at=communication.updated_at
+        )
 
         return result
 
-    def persist(self, case: Case, result: IntakeExtractionResult, communication=None) -> None:
+    def parse_from_findings(
+        self, findings: list[dict], communication: ClientCommunication
+    ) -> IntakeExtractionResult:
+        """
+        Run the parse() transformation pipeline on pre-fetched LLM findings.
+
+        Used by the Batch API backfill path, where findings for many transcripts
+        arrive in one download instead of one synchronous call each. The findings
+        are seeded into the per-parse cache so parse() (and every _extract_*
+        helper it calls) reuses them without touching the API.
+        """
+        turns = communication.raw_transcript or []
+        valid = [f for f in findings if isinstance(f, dict) and f.get("value") is not None]
+        self._findings_cache = {"turns_id": id(turns), "data": valid}
+        return self.parse(communication)
+
+    @transaction.atomic
+    def persist(
+        self,
+        case: Case,
+        result: IntakeExtractionResult,
+        communication=None,
+        final_status: str | None = None,
+    ) -> None:
         """
         Persist an IntakeExtractionResult to the database.
 
+        Runs in a single transaction: one BEGIN/COMMIT pair instead of an
+        autocommit round-trip per write, and a partial failure rolls back
+        cleanly instead of leaving citations without their entities.
+
         Creates / updates:
           - OtherParty records for each entry in result.other_parties
           - MedicalProvider + Treatment records
@@ -104,10 +258,13 @@ class TranscriptParserService:
 
         When ``communication`` is provided, a ClientCommunicationCitation is written
         for every object created, with a CitationReference linking to it when the
-        model is in CitationReference.ALLOWED_CONTENT_TYPES.
+        model is in CitationReference.ALLOWED_CONTENT_TYPES. Passing
+        ``final_status`` also writes communication.parse_status here, saving the
+        caller a separate status UPDATE after persist() returns.
         """
         from django.contrib.contenttypes.models import ContentType
         from intake.models import (
+            ClientCommunication,
             ClientCommunicationCitation,
             CitationReference,
             Damage,
@@ -119,26 +276,69 @@ class TranscriptParserService:
 
         _CONF = {"high": 1.0, "medium": 0.7, "low": 0.4}
 
+        # Hoisted out of the citation loop: one ContentType SELECT per model per
+        # persist() call even on cold workers (get_for_model memoizes in-process,
+        # but the first call per model still hits the DB), and one attribute
+        # resolution for the allowed-model set.
+        ct_by_model = {
+            model: ContentType.objects.get_for_model(model)
+            for model in (OtherParty, MedicalProvider)
+        }
+        allowed_ct_ids = _allowed_citation_ct_ids()
+
+        # Citations are collected here and bulk-inserted at the end (UUID PKs
+        # are assigned Python-side, so references can be built before insert).
+        pending_citations: list[tuple[ClientCommunicationCitation, object | None, str]] = []
+
         def _cite(citation_key: str, data: dict, obj=None, label: str = "") -> None:
-            """Create a citation (and optional reference) from a data dict with _* metadata."""
+            """Queue a citation (and optional reference) from a data dict with _* metadata."""
             if not communication:
                 return
-            cit = ClientCommunicationCitation.objects.create(
+            cit = ClientCommunicationCitation(
                 communication=communication,
+                case=case,
                 citation_key=citation_key,
                 cited_text=data.get("_cited_text") or "",
                 turn_index=data.get("_turn_index"),
                 confidence_score=_CONF.get(str(data.get("_confidence", "high")).lower(), 1.0),
             )
-            if obj is not None:
-                ct = ContentType.objects.get_for_model(obj)
-                if ct.model in CitationReference.ALLOWED_CONTENT_TYPES:
-                    CitationReference.objects.create(
-                        citation=cit,
-                        content_type=ct,
-                        object_id=str(obj.pk),
-                        relationship_label=label,
-                    )
+            pending_citations.append((cit, obj, label))
+
+        def _flush_citations() -> None:
+            """Bulk-insert queued citations and their references in two statements.
+
+            Rows whose (citation_key, turn_index) already exist for this
+            communication are skipped so re-running persist() is idempotent
+            (matching the uniq_citation_per_comm_key_turn constraint).
+            """
+            if not pending_citations:
+                return
+            seen = set(
+                ClientCommunicationCitation.objects.filter(communication=communication)
+                .values_list("citation_key", "turn_index")
+            )
+            citations: list[ClientCommunicationCitation] = []
+            references: list[CitationReference] = []
+            for cit, obj, label in pending_citations:
+                key = (cit.citation_key, cit.turn_index)
+                if key in seen:
+                    continue
+                seen.add(key)
+                citations.append(cit)
+                if obj is not None:
+                    ct = ct_by_model.get(type(obj)) or ContentType.objects.get_for_model(obj)
+                    if ct.id in allowed_ct_ids:
+                        references.append(
+                            CitationReference(
+                                citation=cit,
+                                content_type=ct,
+                                object_id=str(obj.pk),
+                                relationship_label=label,
+                                **{CitationReference.REF_FIELD_BY_MODEL[ct.model]: obj},
+                            )
+                        )
+            ClientCommunicationCitation.objects.bulk_create(citations, batch_size=1000)
+            CitationReference.objects.bulk_create(references, batch_size=1000)
 
         # Update case fields if blank
         changed_fields = []
@@ -151,56 +351,161 @@ class TranscriptParserService:
         if changed_fields:
             case.save(update_fields=changed_fields + ["updated_at"])
 
-        # Other parties
-        for party_data in result.other_parties:
-            party, created = OtherParty.objects.get_or_create(
-                case=case,
-                first_name=party_data.get("first_name", ""),
-                last_name=party_data.get("last_name", ""),
-                defaults={
-                    "company_name": party_data.get("company_name", ""),
-                    "role": party_data.get("role", ""),
-                },
+        # Each entity type below follows the same three-step shape: one SELECT
+        # for pre-existing rows (which doubles as the "created" signal for
+        # citations), one bulk INSERT with ignore_conflicts so concurrent
+        # ingests race safely against the matching unique constraint, and one
+        # SELECT for authoritative rows. get_or_create in a loop was 1-2
+        # round-trips per finding.
+
+        # Other parties — unique on (case, first_name, last_name); the dicts are
+        # probed on lowercased names so "TOM JONES" from one transcript does not
+        # duplicate "Tom Jones" from another
+        if result.other_parties:
+            party_candidates: dict[tuple[str, str], dict] = {}
+            for party_data in result.other_parties:
+                key = (
+                    party_data.get("first_name", "").lower(),
+                    party_data.get("last_name", "").lower(),
+                )
+                party_candidates.setdefault(key, party_data)
+            existing_parties = {
+                (p.first_name.lower(), p.last_name.lower()): p
+                for p in OtherParty.objects.filter(case=case)
+            }
+            OtherParty.objects.bulk_create(
+                [
+                    OtherParty(
+                        case=case,
+                        first_name=data.get("first_name", ""),
+                        last_name=data.get("last_name", ""),
+                        company_name=data.get("company_name", ""),
+                        role=data.get("role", ""),
+                    )
+                    for key, data in party_candidates.items()
+                    if key not in existing_parties
+                ],
+                ignore_conflicts=True,
+                batch_size=500,
             )
-            if created:
-                _cite("other_party", party_data, obj=party, label="at-fault party")
-
-        # Medical providers + treatments
-        for mp_data in result.medical_providers:
-            facility_name = mp_data.get("facility_name", "")
-            facility = None
-            if facility_name:
-                facility, _ = MedicalFacility.objects.get_or_create(name=facility_name)
-
-            provider, created = MedicalProvider.objects.get_or_create(
-                first_name=mp_data.get("first_name", ""),
-                last_name=mp_data.get("last_name", ""),
-                defaults={"facility": facility, "specialty": mp_data.get("specialty", "")},
+            parties = {
+                (p.first_name.lower(), p.last_name.lower()): p
+                for p in OtherParty.objects.filter(case=case)
+            }
+            for key, data in party_candidates.items():
+                if key not in existing_parties:
+                    _cite("other_party", data, obj=parties[key], label="at-fault party")
+
+        # Medical providers + treatments — facilities unique on name, providers
+        # on (first_name, last_name), treatments on (case, provider)
+        if result.medical_providers:
+            facility_names = {
+                mp_data["facility_name"]
+                for mp_data in result.medical_providers
+                if mp_data.get("facility_name")
+            }
+            facilities: dict[str, MedicalFacility] = {}
+            if facility_names:
+                MedicalFacility.objects.bulk_create(
+                    [MedicalFacility(name=name) for name in facility_names],
+                    ignore_conflicts=True,
+                    batch_size=500,
+                )
+                facilities = {
+                    f.name: f for f in MedicalFacility.objects.filter(name__in=facility_names)
+                }
+
+            provider_candidates: dict[tuple[str, str], dict] = {}
+            for mp_data in result.medical_providers:
+                key = (
+                    mp_data.get("first_name", "").lower(),
+                    mp_data.get("last_name", "").lower(),
+                )
+                provider_candidates.setdefault(key, mp_data)
+            last_name_q = Q()
+            for _fn, ln in provider_candidates:
+                last_name_q |= Q(last_name__iexact=ln)
+            existing_providers = {
+                (p.first_name.lower(), p.last_name.lower()): p
+                for p in MedicalProvider.objects.filter(last_name_q).select_related("facility")
+            }
+            MedicalProvider.objects.bulk_create(
+                [
+                    MedicalProvider(
+                        first_name=data.get("first_name", ""),
+                        last_name=data.get("last_name", ""),
+                        facility=facilities.get(data.get("facility_name", "")),
+                        specialty=data.get("specialty", ""),
+                    )
+                    for key, data in provider_candidates.items()
+                    if key not in existing_providers
+                ],
+                ignore_conflicts=True,
+                batch_size=500,
             )
-            if created:
-                _cite("medical_provider", mp_data, obj=provider, label="treating provider")
+            providers = {
+                (p.first_name.lower(), p.last_name.lower()): p
+                for p in MedicalProvider.objects.filter(last_name_q)
+            }
+            for key, data in provider_candidates.items():
+                if key not in existing_providers:
+                    _cite("medical_provider", data, obj=providers[key], label="treating provider")
 
-            Treatment.objects.get_or_create(
-                case=case,
-                provider=provider,
-                defaults={
-                    "treatment_type": mp_data.get("treatment_type", ""),
-                    "diagnosis": mp_data.get("diagnosis", ""),
-                },
+            treated_providers = set(
+                Treatment.objects.filter(case=case).values_list("provider_id", flat=True)
+            )
+            Treatment.objects.bulk_create(
+                [
+                    Treatment(
+                        case=case,
+                        provider=providers[key],
+                        treatment_type=data.get("treatment_type", ""),
+                        diagnosis=data.get("diagnosis", ""),
+                    )
+                    for key, data in provider_candidates.items()
+                    if providers[key].pk not in treated_providers
+                ],
+                ignore_conflicts=True,
+                batch_size=500,
             )
 
-        # Damages
-        for dmg_data in result.damages:
-            damage, created = Damage.objects.get_or_create(
-                case=case,
-                category=dmg_data.get("category", "other"),
-                defaults={
-                    "description": dmg_data.get("description", ""),
-                    "estimated_amount": dmg_data.get("estimated_amount"),
-                },
+        # Damages — unique on (case, category)
+        if result.damages:
+            damage_candidates: dict[str, dict] = {}
+            for dmg_data in result.damages:
+                damage_candidates.setdefault(dmg_data.get("category", "other"), dmg_data)
+            existing_categories = set(
+                Damage.objects.filter(case=case).values_list("category", flat=True)
+            )
+            Damage.objects.bulk_create(
+                [
+                    Damage(
+                        case=case,
+                        category=category,
+                        description=data.get("description", ""),
+                        estimated_amount=data.get("estimated_amount"),
+                    )
+                    for category, data in damage_candidates.items()
+                    if category not in existing_categories
+                ],
+                ignore_conflicts=True,
+                batch_size=500,
+            )
+            for category, data in damage_candidates.items():
+                if category not in existing_categories:
+                    _cite("financial_expense", data)
+
+        _flush_citations()
+
+        if communication is not None and final_status:
+            # QuerySet.update() instead of save() — one UPDATE, no signal
+            # machinery, and inside this atomic block it folds into the same
+            # commit as the citation inserts.
+            communication.parse_status = final_status
+            communication.updated_at = timezone.now()
+            ClientCommunication.objects.filter(pk=communication.pk).update(
+                parse_status=final_status, updated_at=communication.updated_at
             )
-            if created:
-                _cite("financial_expense", dmg_data)
 
     def ingest(
         self,
@@ -224,95 +529,150 @@ class TranscriptParserService:
         # 1. Single LLM call — all _extract_* methods share this cache
         findings = self._call_llm(turns)
 
-        # 2. Index metadata findings by field
+        # 2. Route each finding into its (finding_type, field) bucket once;
+        # the extractors below read their slice instead of re-scanning the
+        # full list
+        buckets = self._bucket_findings(findings)
         meta: dict[str, dict] = {
-            f["field"]: f
-            for f in findings
-            if f.get("finding_type") == "metadata"
+            field_name: fs[-1]
+            for (finding_type, field_name), fs in buckets.items()
+            if finding_type == "metadata"
         }
 
-        # 3. LawFirm
-        if law_firm_id:
-            law_firm = LawFirm.objects.get(pk=law_firm_id)
-        else:
-            firm_name = (meta.get("law_firm_name") or {}).get("value") or "Unknown Law Firm"
-            law_firm, _ = LawFirm.objects.get_or_create(name=firm_name)
-
-        # 4. Extract caller identity + incident info (cache hits after step 1)
-        caller_name = (meta.get("caller_name") or {}).get("value") or ""
-        name_parts = caller_name.strip().split(" ", 1)
-        first_name = name_parts[0] if len(name_parts) == 2 else ""
-        last_name = name_parts[1] if len(name_parts) == 2 else name_parts[0]
-        incident_info = self._extract_incident_info(turns)
-
-        # 5. Try to match an existing Client + Case before creating anything new
-        matched = False
-        existing = self._find_existing_case(
-            law_firm=law_firm,
-            first_name=first_name,
-            last_name=last_name,
-            incident_type=incident_info.get("incident_type"),
-            incident_date=incident_info.get("incident_date"),
-            incident_location=incident_info.get("incident_location"),
-        )
-
-        if existing:
-            client, case = existing
-            matched = True
-        else:
-            # Create new Client (get_or_create handles duplicate calls)
-            client, _ = Client.objects.get_or_create(
+        # Steps 3-10 share one transaction so LawFirm/Client/Case/communication
+        # and all downstream records commit together (the LLM call in step 1
+        # deliberately stays outside it).
+        with transaction.atomic():
+            # 3. LawFirm
+            if law_firm_id:
+                law_firm = LawFirm.objects.get(pk=law_firm_id)
+            else:
+                firm_name = (meta.get("law_firm_name") or {}).get("value") or "Unknown Law Firm"
+                law_firm, _ = LawFirm.objects.get_or_create(name=firm_name)
+
+            # 4. Extract caller identity + incident info (cache hits after step 1)
+            caller_name = (meta.get("caller_name") or {}).get("value") or ""
+            name_parts = caller_name.strip().split(" ", 1)
+            first_name = name_parts[0] if len(name_parts) == 2 else ""
+            last_name = name_parts[1] if len(name_parts) == 2 else name_parts[0]
+            incident_info = self._extract_incident_info(turns, buckets=buckets)
+
+            # 5. Try to match an existing Client + Case before creating anything new
+            matched = False
+            existing = self._find_existing_case(
                 law_firm=law_firm,
                 first_name=first_name,
                 last_name=last_name,
+                incident_type=incident_info.get("incident_type"),
+                incident_date=incident_info.get("incident_date"),
+                incident_location=incident_info.get("incident_location"),
             )
-            # Always create a new Case when no match is found
-            case = Case.objects.create(
+
+            if existing:
+                client, case = existing
+                matched = True
+            else:
+                # Create new Client (get_or_create handles duplicate calls)
+                client, _ = Client.objects.get_or_create(
+                    law_firm=law_firm,
+                    first_name=first_name,
+                    last_name=last_name,
+                )
+                # Always create a new Case when no match is found
+                case = Case.objects.create(
+                    client=client,
+                    case_number=f"INTAKE-{uuid4().hex[:8].upper()}",
+                    incident_type=incident_info.get("incident_type") or Case.IncidentType.OTHER,
+                    incident_date=incident_info.get("incident_date"),
+                    incident_location=incident_info.get("incident_location") or "",
+                )
+
+            # 6. ClientCommunication
+            communication = ClientCommunication.objects.create(
                 client=client,
-                case_number=f"INTAKE-{uuid4().hex[:8].upper()}",
-                incident_type=incident_info.get("incident_type") or "",
+                case=case,
+                channel="phone",
+                raw_transcript=turns,
+                parse_status="processing",
+            )
+
+            # 6b. Metadata citations — only for newly created records
+            if not matched:
+                self._write_metadata_citations(communication, meta, client)
+
+            # 7. Build IntakeExtractionResult — each extractor reads its own
+            # field bucket, no per-extractor re-scan of the findings list
+            result = IntakeExtractionResult(
                 incident_date=incident_info.get("incident_date"),
-                incident_location=incident_info.get("incident_location") or "",
+                incident_type=incident_info.get("incident_type"),
+                incident_location=incident_info.get("incident_location"),
+                injuries=incident_info.get("injuries", []),
+                medical_providers=self._extract_medical(turns, buckets=buckets),
+                insurance_carriers=self._extract_insurance(turns, buckets=buckets),
+                other_parties=self._extract_parties(turns, buckets=buckets),
+                damages=self._extract_damages(turns, buckets=buckets),
+                confidence_scores=incident_info.get("confidence_scores", {}),
             )
 
-        # 6. ClientCommunication
-        communication = ClientCommunication.objects.create(
-            client=client,
-            case=case,
-            channel="phone",
-            raw_transcript=turns,
-            parse_status="processing",
-        )
+            # 8. Flag risks
+            result.raw_flags = self._flag_risks(result, findings)
 
-        # 6b. Metadata citations — only for newly created records
-        if not matched:
-            self._write_metadata_citations(communication, meta, client)
+            # 9. Persist downstream records (with communication so citations are
+            # written) and mark done in the same pass
+            self.persist(case, result, communication=communication, final_status="done")
 
-        # 7. Build IntakeExtractionResult (all _extract_* are cache hits)
-        result = IntakeExtractionResult(
-            incident_date=incident_info.get("incident_date"),
-            incident_type=incident_info.get("incident_type"),
-            incident_location=incident_info.get("incident_location"),
-            injuries=incident_info.get("injuries", []),
-            medical_providers=self._extract_medical(turns),
-            insurance_carriers=self._extract_insurance(turns),
-            other_parties=self._extract_parties(turns),
-            damages=self._extract_damages(turns),
-            confidence_scores=incident_info.get("confidence_scores", {}),
+        # 10. Return
+        return communication, result, matched
+
+    async def aingest(
+        self,
+        turns: list[dict],
+        law_firm_id: str | None = None,
+    ) -> tuple[ClientCommunication, IntakeExtractionResult, bool]:
+        """
+        Async counterpart of ingest().
+
+        The LLM call runs on the event loop via AsyncOpenAI; the findings it
+        fetches seed the per-parse cache, so the delegated ingest() — which runs
+        synchronously in a worker thread via sync_to_async — never issues its own
+        API call. Semantics and return value match ingest() exactly.
+        """
+        await self._acall_llm(turns)
+        return await sync_to_async(self.ingest, thread_sensitive=True)(
+            turns, law_firm_id=law_firm_id
         )
 
-        # 8. Flag risks
-        result.raw_flags = self._flag_risks(result)
+    def ingest_many(
+        self,
+        turns_list: list[list[dict]],
+        law_firm_id: str | None = None,
+        concurrency: int = 10,
+    ) -> list[tuple[ClientCommunication, IntakeExtractionResult, bool] | BaseException]:
+        """
+        Ingest many transcripts concurrently from synchronous code.
 
-        # 9. Persist downstream records (with communication so citations are written)
-        self.persist(case, result, communication=communication)
+        Wall-clock for N transcripts drops from N model calls in series to
+        roughly one, since the work is I/O-bound on the API. Concurrency is
+        bounded by a semaphore to respect rate limits. Each transcript gets its
+        own service instance because the per-parse findings cache is instance
+        state.
 
-        # 10. Mark done
-        communication.parse_status = "done"
-        communication.save(update_fields=["parse_status", "updated_at"])
+        Returns a list aligned with ``turns_list``; entries for failed ingests
+        are the raised exception objects (gather with return_exceptions=True).
+        """
 
-        # 11. Return
-        return communication, result, matched
+        async def _run():
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _worker(turns: list[dict]):
+                async with semaphore:
+                    return await type(self)().aingest(turns, law_firm_id=law_firm_id)
+
+            return await asyncio.gather(
+                *(_worker(turns) for turns in turns_list), return_exceptions=True
+            )
+
+        return asyncio.run(_run())
 
     def _write_metadata_citations(self, communication, meta: dict, client) -> None:
         """
@@ -329,25 +689,36 @@ class TranscriptParserService:
         from intake.models import ClientCommunicationCitation, CitationReference
 
         _CONF = {"high": 1.0, "medium": 0.7, "low": 0.4}
+        allowed_ct_ids = _allowed_citation_ct_ids()
+
+        # Citation UUID PKs are assigned Python-side, so references can be built
+        # before anything is inserted — one bulk INSERT per model at the end.
+        citations: list[ClientCommunicationCitation] = []
+        references: list[CitationReference] = []
 
         def _cite_meta(citation_key: str, finding: dict | None, obj=None, label: str = "") -> None:
             if not finding:
                 return
-            cit = ClientCommunicationCitation.objects.create(
+            cit = ClientCommunicationCitation(
                 communication=communication,
+                case_id=communication.case_id,
                 citation_key=citation_key,
                 cited_text=finding.get("quote") or str(finding.get("value", "")),
                 turn_index=finding.get("transcript_index"),
                 confidence_score=_CONF.get(str(finding.get("confidence", "high")).lower(), 1.0),
             )
+            citations.append(cit)
             if obj is not None:
                 ct = ContentType.objects.get_for_model(obj)
-                if ct.model in CitationReference.ALLOWED_CONTENT_TYPES:
-                    CitationReference.objects.create(
-                        citation=cit,
-                        content_type=ct,
-                        object_id=str(obj.pk),
-                        relationship_label=label,
+                if ct.id in allowed_ct_ids:
+                    references.append(
+                        CitationReference(
+                            citation=cit,
+                            content_type=ct,
+                            object_id=str(obj.pk),
+                            relationship_label=label,
+                            **{CitationReference.REF_FIELD_BY_MODEL[ct.model]: obj},
+                        )
                     )
 
         _cite_meta("caller_name", meta.get("caller_name"), obj=client, label="identified caller")
@@ -355,6 +726,9 @@ class TranscriptParserService:
         _cite_meta("case_type", meta.get("case_type"))
         _cite_meta("incident_location", meta.get("incident_location"))
 
+        ClientCommunicationCitation.objects.bulk_create(citations, batch_size=1000)
+        CitationReference.objects.bulk_create(references, batch_size=1000)
+
     def _find_existing_case(
         self,
         law_firm,
@@ -379,7 +753,10 @@ class TranscriptParserService:
         from intake.models import Client
 
         # --- Client match ---
-        client_qs = Client.objects.filter(
+        # Row locks (no-op on SQLite) keep two concurrent ingests of the same
+        # caller from both missing the match and creating duplicate rows; the
+        # caller's transaction holds them until commit.
+        client_qs = Client.objects.select_for_update().filter(
             law_firm=law_firm,
             first_name__iexact=first_name,
             last_name__iexact=last_name,
@@ -390,7 +767,7 @@ class TranscriptParserService:
         # Prefer the most recently created client if there are duplicates
         client = client_qs.order_by("-created_at").first()
 
-        case_qs = client.case_set.all()
+        case_qs = client.case_set.select_for_update()
         if not case_qs.exists():
             return None
 
@@ -427,153 +804,274 @@ class TranscriptParserService:
     # ------------------------------------------------------------------
 
     _SYSTEM_PROMPT = """\
-You are a legal intake AI assistant specializing in personal injury law. You analyze \
-transcripts from intake calls at personal injury law firms. Approximately 90% of calls \
-involve assessing claim viability for potential clients who may have been injured due to \
-someone else's negligence.
-
-Your job is to extract structured information from the transcript and return it as a \
-JSON object. Be precise and conservative — do NOT guess or invent information. If you are \
-not confident about a value, return null for that field.
-
-Extract the following categories:
-
-METADATA (one finding per field):
-  - caller_name       : Full name of the person calling
-  - law_firm_name     : Name of the law firm the Intake Specialist represents
-  - case_type         : One of: auto_accident, slip_fall, medical_malpractice,
-                        workers_comp, wrongful_death, product_liability, other
-  - accident_date     : Date of the accident/incident in ISO format (YYYY-MM-DD), or null.
-                        Dates may be spoken in any format — "March 3rd", "3/3", "the third
-                        of March", "last Tuesday", or relative references like "two weeks
-                        ago". Convert all formats to ISO (YYYY-MM-DD). For relative dates,
-                        use the transcript context clues to anchor the date if possible;
-                        if the year is ambiguous, prefer the most recent plausible year.
-                        Do NOT return null simply because the date was not in ISO format —
-                        only return null if no date reference exists at all.
-  - incident_location : Where the incident occurred (city, address, or description)
-  - injuries          : Comma-separated list of injuries the caller describes, or null
-
-INDIVIDUAL FINDINGS (one finding per discovered entity, no duplicates):
-  - other_party       : Individuals or entities named as at-fault or adverse parties
-  - insurance_provider: Insurance companies mentioned (either party's insurer)
-  - medical_provider  : Any doctor, hospital, clinic, therapist, chiropractor, urgent care,
-                        emergency room, specialist, or other medical/rehabilitation service
-                        mentioned — regardless of whether a cost was discussed. Capture the
-                        provider even if the caller only says they "went to", "saw",
-                        "visited", or "have an appointment with" them.
-  - financial_expense : Specific costs, bills, lost wages, property damage estimates, or
-                        other financial damages the caller has discussed. A dollar amount
-                        is NOT required — capture any expense the caller references even
-                        if the amount is unknown or not yet determined (e.g. "my medical
-                        bills are piling up", "I missed two weeks of work"). Use a
-                        descriptive label for the value if no amount is given.
-  - treatment         : Any medical treatment, procedure, therapy session, prescription,
-                        or rehabilitation activity the caller has received or is receiving,
-                        even if no provider name or cost is associated with it (e.g.
-                        "I've been doing physical therapy", "they gave me pain medication",
-                        "I'm in a boot"). One finding per distinct treatment type.
-
-For every individual finding include ALL of the following citation fields:
-  - transcript_index      : The 0-based index of the transcript turn where this entity is
-                            FIRST mentioned. Search carefully — dates, names, and providers
-                            are often introduced early and referenced again later. Always
-                            cite the FIRST occurrence.
-  - transcript_indices    : An array of ALL 0-based turn indices where this entity is
-                            mentioned or referenced, including indirect references and
-                            pronouns that clearly refer back to this entity.
-  - quote                 : The verbatim excerpt (≤ 2 sentences) from the cited turn that
-                            most directly establishes this finding. Pull from the turn at
-                            transcript_index.
-  - confidence            : One of: "high", "medium", "low". Use "high" when explicitly
-                            stated, "medium" when strongly implied, "low" when inferred
-                            from limited context.
-  - related_to            : An object with keys caller, other_party, insurance_provider,
-                            medical_provider — set each to the relevant name string if this
-                            entity is connected to them. If the connection is POSSIBLE but
-                            not confirmed, prefix the value with "possible: " (e.g.
-                            "possible: State Farm"). Only set to null if there is truly no
-                            plausible connection.
-
-Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
-{
-  "findings": [
-    {
-      "finding_type": "metadata",
-      "field": "caller_name",
-      "value": "Jane Smith",
-      "transcript_index": 2,
-      "transcript_indices": [2, 5, 11],
-      "quote": "My name is Jane Smith, I was calling about an accident.",
-      "confidence": "high"
-    },
-    {
-      "finding_type": "individual",
-      "field": "medical_provider",
-      "value": "St. Mary's Hospital",
-      "transcript_index": 7,
-      "transcript_indices": [7, 9, 14],
-      "quote": "I went to St. Mary's Hospital the night of the accident.",
-      "confidence": "high",
-      "related_to": {
-        "caller": "Jane Smith",
-        "other_party": null,
-        "insurance_provider": "possible: State Farm",
-        "medical_provider": null
-      }
-    },
-    {
-      "finding_type": "individual",
-      "field": "financial_expense",
-      "value": "Ongoing medical bills (amount unknown)",
-      "transcript_index": 12,
-      "transcript_indices": [12],
-      "quote": "My medical bills are just piling up and I don't know what to do.",
-      "confidence": "medium",
-      "related_to": {
-        "caller": "Jane Smith",
-        "other_party": null,
-        "insurance_provider": null,
-        "medical_provider": "possible: St. Mary's Hospital"
-      }
-    },
-    {
-      "finding_type": "individual",
-      "field": "treatment",
-      "value": "Physical therapy",
-      "transcript_index": 15,
-      "transcript_indices": [15, 18],
-      "quote": "I've been doing physical therapy twice a week since the accident.",
-      "confidence": "high",
-      "related_to": {
-        "caller": "Jane Smith",
-        "other_party": null,
-        "insurance_provider": null,
-        "medical_provider": null
-      }
-    }
-  ]
-}
+You are a legal intake analyst for personal injury law firms. Extract structured \
+findings from the intake call transcript and report them ONLY by calling the \
+emit_findings tool. Be precise and conservative — never guess or invent; use a null \
+value when not confident.
+
+Rules:
+- One metadata finding per field: caller_name, law_firm_name, case_type, \
+accident_date, incident_location, injuries (comma-separated list).
+- accident_date: convert any spoken form ("March 3rd", "3/3", "two weeks ago") to ISO \
+YYYY-MM-DD, anchoring relative dates from transcript context; if the year is ambiguous \
+prefer the most recent plausible one; null only if no date reference exists at all.
+- One individual finding per distinct entity, no duplicates:
+  - other_party: at-fault or adverse individuals/entities.
+  - insurance_provider: any insurer mentioned, either party's.
+  - medical_provider: any medical/rehabilitation service mentioned ("went to", "saw", \
+"have an appointment with" counts), cost discussed or not.
+  - financial_expense: any cost, bill, lost wages or property damage referenced — a \
+dollar amount is NOT required; use a descriptive label when none is given.
+  - treatment: any treatment, procedure, therapy, prescription or rehab activity \
+received, one finding per distinct type.
+- Cite the FIRST mention: transcript_index is the 0-based turn of first occurrence \
+(entities are often introduced early and referenced again later); transcript_indices \
+lists ALL turns referencing the entity, including pronoun references; quote is a \
+verbatim excerpt (at most 2 sentences) from the turn at transcript_index.
+- confidence: "high" explicitly stated, "medium" strongly implied, "low" inferred.
+- related_to: set each key to the connected entity's name; prefix unconfirmed links \
+with "possible: "; null only when no plausible connection exists.
 """
 
-    # Maps LLM case_type values → Case.IncidentType choices
+    # JSON Schema for the emit_findings tool — enforces the envelope the old
+    # prompt demonstrated with a ~2KB worked example. Strict-mode compliant:
+    # every object closes additionalProperties and requires all keys, with
+    # null unions standing in for optionality, so constrained decoding
+    # guarantees a conforming response.
+    _FINDINGS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "findings": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "finding_type": {"type": "string", "enum": ["metadata", "individual"]},
+                        "field": {
+                            "type": "string",
+                            "enum": [
+                                "caller_name",
+                                "law_firm_name",
+                                "case_type",
+                                "accident_date",
+                                "incident_location",
+                                "injuries",
+                                "other_party",
+                                "insurance_provider",
+                                "medical_provider",
+                                "financial_expense",
+                                "treatment",
+                            ],
+                        },
+                        "value": {
+                            "type": ["string", "null"],
+                            "description": (
+                                "Extracted value; null when not confident. For "
+                                "case_type, one of: auto_accident, slip_fall, "
+                                "medical_malpractice, workers_comp, wrongful_death, "
+                                "product_liability, other."
+                            ),
+                        },
+                        "transcript_index": {"type": ["integer", "null"]},
+                        "transcript_indices": {"type": "array", "items": {"type": "integer"}},
+                        "quote": {"type": ["string", "null"]},
+                        "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+                        "related_to": {
+                            "type": ["object", "null"],
+                            "properties": {
+                                "caller": {"type": ["string", "null"]},
+                                "other_party": {"type": ["string", "null"]},
+                                "insurance_provider": {"type": ["string", "null"]},
+                                "medical_provider": {"type": ["string", "null"]},
+                            },
+                            "required": [
+                                "caller",
+                                "other_party",
+                                "insurance_provider",
+                                "medical_provider",
+                            ],
+                            "additionalProperties": False,
+                        },
+                    },
+                    "required": [
+                        "finding_type",
+                        "field",
+                        "value",
+                        "transcript_index",
+                        "transcript_indices",
+                        "quote",
+                        "confidence",
+                        "related_to",
+                    ],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["findings"],
+        "additionalProperties": False,
+    }
+
+    _FINDINGS_TOOL = {
+        "type": "function",
+        "function": {
+            "name": "emit_findings",
+            "description": "Report all findings extracted from the transcript.",
+            "strict": True,
+            "parameters": _FINDINGS_SCHEMA,
+        },
+    }
+
+    # Forced so the model always answers with a tool call, never prose
+    _TOOL_CHOICE = {"type": "function", "function": {"name": "emit_findings"}}
+
+    # Bump whenever _SYSTEM_PROMPT or _FINDINGS_SCHEMA changes so stale cached
+    # findings are not reused
+    PROMPT_VERSION = "2026-08.1"
+
+    # Routing key for OpenAI's server-side prompt cache — all extraction calls
+    # share the same static prefix (system prompt + tool schema), so keeping
+    # them on one key maximises prefix-cache hits.
+    _PROMPT_CACHE_KEY = "intake-transcript-parser"
+
+    # Transcripts shorter than this many turns are routed to the cheaper model.
+    _SHORT_TRANSCRIPT_TURNS = 10
+
+    # Transcripts longer than this are extracted in chunks and the findings
+    # merged, so one marathon call cannot blow out the prompt budget.
+    _MAX_TURNS_PER_PROMPT = 150
+
+    # Chunk extractions are independent, so they run concurrently — but
+    # bounded, so one marathon transcript cannot eat the provider rate limit.
+    _MAX_CONCURRENT_CHUNKS = 4
+
+    # Deterministic viability pre-pass: wrong numbers, hang-ups and other
+    # non-substantive calls never mention anything injury-adjacent, so they
+    # can skip the model round-trip entirely.
+    _VIABILITY_MIN_CHARS = 200
+    _VIABILITY_RE = re.compile(
+        r"\b(accident|injur|hurt|hit|fell|slipped|car|fault|insurance)", re.IGNORECASE
+    )
+
+    @classmethod
+    def _is_viable(cls, turns: list[dict]) -> bool:
+        """Whether a transcript is worth an LLM call at all."""
+        total_chars = sum(len(t.get("text", "")) for t in turns)
+        if total_chars < cls._VIABILITY_MIN_CHARS:
+            return False
+        return any(cls._VIABILITY_RE.search(t.get("text", "")) for t in turns)
+
+    # Findings scale with turn count; capping completion tokens keeps decode
+    # time proportional to the transcript rather than the model's ceiling.
+    _MAX_COMPLETION_TOKENS = 4000
+    _COMPLETION_TOKENS_PER_TURN = 200
+
+    @classmethod
+    def _llm_model(cls, turns: list[dict] | None = None) -> str:
+        """
+        Extraction model for a transcript.
+
+        Short transcripts rarely contain enough findings to need the large
+        model, so they are routed to INTAKE_LLM_MODEL_SHORT; everything else
+        uses INTAKE_LLM_MODEL_LONG. Both fall back to INTAKE_LLM_MODEL so a
+        single-model deployment keeps working unchanged.
+        """
+        default = getattr(settings, "INTAKE_LLM_MODEL", "gpt-5")
+        if turns is not None and len(turns) < cls._SHORT_TRANSCRIPT_TURNS:
+            return getattr(settings, "INTAKE_LLM_MODEL_SHORT", None) or default
+        return getattr(settings, "INTAKE_LLM_MODEL_LONG", None) or default
+
+    @classmethod
+    def _max_completion_tokens(cls, turns: list[dict]) -> int:
+        """Completion-token cap scaled to transcript length."""
+        return min(cls._MAX_COMPLETION_TOKENS, cls._COMPLETION_TOKENS_PER_TURN * max(len(turns), 1))
+
+    def _render_transcript(self, turns: list[dict]) -> str:
+        """
+        Render turns as indexed "[i] Speaker: text" lines, cached per turns list.
+
+        Retries and the sync/batch/async call paths reuse the rendered text for
+        one parse instead of re-concatenating it; the StringIO loop also avoids
+        the per-turn intermediate strings of a join over a generator, which adds
+        up on very long calls.
+        """
+        cached = getattr(self, "_rendered_turns_cache", None)
+        if cached is not None and cached.get("turns_id") == id(turns):
+            return cached["text"]
+
+        out = io.StringIO()
+        write = out.write
+        for i, turn in enumerate(turns):
+            if i:
+                write("\n")
+            write(f"[{i}] {turn.get('speaker', 'Unknown')}: {turn.get('text', '')}")
+        text = out.getvalue()
+
+        self._rendered_turns_cache = {"turns_id": id(turns), "text": text}
+        return text
+
+    def _collect_stream(self, stream) -> str:
+        """Drain a streamed tool-call response into its raw arguments string."""
+        parts: list[str] = []
+        for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                self._log_prompt_cache(chunk)
+            if not chunk.choices:
+                continue
+            for tool_call in chunk.choices[0].delta.tool_calls or []:
+                if tool_call.function and tool_call.function.arguments:
+                    parts.append(tool_call.function.arguments)
+        return "".join(parts)
+
+    async def _collect_stream_async(self, stream) -> str:
+        """Async counterpart of _collect_stream."""
+        parts: list[str] = []
+        async for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                self._log_prompt_cache(chunk)
+            if not chunk.choices:
+                continue
+            for tool_call in chunk.choices[0].delta.tool_calls or []:
+                if tool_call.function and tool_call.function.arguments:
+                    parts.append(tool_call.function.arguments)
+        return "".join(parts)
+
+    @staticmethod
+    def _log_prompt_cache(response) -> None:
+        """Record how many prompt tokens the API served from its prefix cache."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None)
+        if cached:
+            logger.debug("_call_llm: %s prompt tokens served from cache", cached)
+
+    # Transcripts are immutable once recorded, so cached findings stay valid for
+    # as long as the prompt version does; the TTL just bounds cache growth.
+    _FINDINGS_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+    # Folds spaces and hyphens into underscores so _INCIDENT_TYPE_MAP needs one
+    # canonical key per variant family instead of a hand-maintained explosion
+    _NORM = str.maketrans(" -", "__")
+
+    # Maps normalized LLM case_type values → Case.IncidentType choices
     _INCIDENT_TYPE_MAP: dict[str, str] = {
         "auto_accident": "auto",
-        "auto accident": "auto",
         "slip_fall": "slip_fall",
-        "slip and fall": "slip_fall",
+        "slip_and_fall": "slip_fall",
         "medical_malpractice": "medical_malpractice",
-        "medical malpractice": "medical_malpractice",
         "workers_comp": "workplace",
-        "workers compensation": "workplace",
+        "workers_compensation": "workplace",
         "workplace": "workplace",
         "product_liability": "product_liability",
-        "product liability": "product_liability",
         "wrongful_death": "other",
-        "wrongful death": "other",
         "other": "other",
     }
 
+    @classmethod
+    def _map_incident_type(cls, value) -> str:
+        """Map an LLM case_type value onto a Case.IncidentType choice."""
+        key = str(value).lower().translate(cls._NORM).strip("_")
+        return cls._INCIDENT_TYPE_MAP.get(key, "other")
+
     # Keywords that suggest a value is a facility/company rather than an individual
     _FACILITY_KEYWORDS = frozenset(
         ["hospital", "clinic", "center", "centre", "medical", "health", "urgent care",
@@ -585,12 +1083,66 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
          "transport", "logistics", "construction", "properties", "management"]
     )
 
+    # Compiled once at class load: a single alternation scan beats the
+    # O(keywords x length) any(k in s ...) membership loop and stays flat as
+    # the keyword lists grow. Longest-first ordering keeps prefixed keywords
+    # ("co." vs "company") from shadowing each other.
+    # IGNORECASE folds case inside the C engine, so callers skip the per-row
+    # .lower() copy.
+    _FACILITY_RE = re.compile(
+        "|".join(re.escape(k) for k in sorted(_FACILITY_KEYWORDS, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    _COMPANY_RE = re.compile(
+        "|".join(re.escape(k) for k in sorted(_COMPANY_KEYWORDS, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+
+    # Compiled once at class scope — these run per finding on the extraction
+    # hot path, and module-level compilation skips re's cache lookup and flag
+    # parsing per call.
+    _DR_RE = re.compile(r"^(?:Dr\.?|Doctor)\s+", re.IGNORECASE)
+    _AMOUNT_RE = re.compile(r"\$?([\d,]+(?:\.\d+)?)")
+    _DAMAGE_KEYWORD_RE = re.compile(
+        r"lost income|lost earnings|future|wage|medical|hospital|doctor|bill"
+        r"|treatment|property|vehicle|car|truck|repair"
+    )
+    _LOST_WAGE_KEYWORDS = frozenset({"wage", "lost income", "lost earnings"})
+    _MEDICAL_KEYWORDS = frozenset({"medical", "hospital", "doctor", "bill", "treatment"})
+    _PROPERTY_KEYWORDS = frozenset({"property", "vehicle", "car", "truck", "repair"})
+
+    # Trimmed, non-empty comma-separated tokens in one scan — no intermediate
+    # split list or per-element .strip().
+    _CSV_TOKEN_RE = re.compile(r"\s*([^,\s](?:[^,]*[^,\s])?)\s*(?:,|$)")
+
+    @classmethod
+    def _split_csv(cls, raw: object) -> list[str]:
+        """Split a comma-separated metadata value into trimmed tokens."""
+        return cls._CSV_TOKEN_RE.findall(str(raw))
+
+    def _findings_cache_key(self, turns: list[dict], model: str = "gpt-5") -> str:
+        """
+        Content-addressable cache key for a transcript's findings.
+
+        Keyed by (prompt version, model, blake2b of the canonical-JSON turns) so
+        a re-ingest of the same transcript — retry, duplicate webhook, dev
+        replay — hits the cache across process restarts, and editing the prompt
+        or switching models invalidates in lockstep. blake2b at 16 bytes is
+        faster than sha256 and plenty for a cache key (no adversarial input).
+        """
+        canonical = orjson.dumps(turns, option=orjson.OPT_SORT_KEYS, default=str)
+        digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+        return f"intake-findings:{self.PROMPT_VERSION}:{model}:{digest}"
+
     def _call_llm(self, turns: list[dict]) -> list[dict]:
         """
         Make a single OpenAI API call to extract all findings from the transcript.
 
-        Results are cached on the instance keyed by the id() of the turns list, so
-        all _extract_* methods called within one parse() invocation share one call.
+        Results are cached at two levels: on the instance keyed by the id() of the
+        turns list (so all _extract_* methods called within one parse() invocation
+        share one call), and persistently in the Django cache keyed by transcript
+        content (so re-ingesting an identical transcript never repays the model
+        call, even after a restart).
 
         Returns a list of finding dicts as described in the system prompt, with null-
         valued entries already filtered out.
@@ -600,15 +1152,64 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
         """
         # Cache keyed by identity of the turns list object (same object across one
         # parse() call; a new parse() call creates a new list with a new id).
-        cache = getattr(self, "_findings_cache", None)
-        if cache is not None and cache.get("turns_id") == id(turns):
-            return cache["data"]
-
-        # Short-circuit for empty/very short transcripts
-        if not turns:
+        local = getattr(self, "_findings_cache", None)
+        if local is not None and local.get("turns_id") == id(turns):
+            return local["data"]
+
+        # Short-circuit for empty or clearly non-substantive transcripts
+        # (wrong numbers, hang-ups) — no point paying for a model call that
+        # can only return nothing.
+        if not turns or not self._is_viable(turns):
+            if turns:
+                logger.info("non_viable_call: skipping LLM extraction (%d turns)", len(turns))
             self._findings_cache = {"turns_id": id(turns), "data": []}
             return []
 
+        model = self._llm_model(turns)
+        cache_key = self._findings_cache_key(turns, model=model)
+
+        # In-process LRU first (no backend round-trip or deserialization),
+        # then the persistent content-addressed cache — a hash is
+        # microseconds, the model call is seconds and dollars.
+        cached = _findings_memo_get(cache_key)
+        if cached is None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                _findings_memo_set(cache_key, cached)
+        if cached is not None:
+            self._findings_cache = {"turns_id": id(turns), "data": cached}
+            return cached
+
+        # Very long transcripts are chunked into bounded prompts and the
+        # findings merged back with their indices rebased to the full
+        # transcript. Keeps prompt size (and prefill cost) capped; each chunk
+        # gets its own persistent cache entry via the recursive call.
+        if len(turns) > self._MAX_TURNS_PER_PROMPT:
+            starts = list(range(0, len(turns), self._MAX_TURNS_PER_PROMPT))
+            chunks = [turns[s : s + self._MAX_TURNS_PER_PROMPT] for s in starts]
+            # Each chunk on a fresh instance (the per-parse cache is instance
+            # state), concurrently but bounded; pool.map preserves chunk order
+            # so the merged indices stay monotonic.
+            with ThreadPoolExecutor(
+                max_workers=min(len(chunks), self._MAX_CONCURRENT_CHUNKS)
+            ) as pool:
+                chunk_results = list(
+                    pool.map(lambda chunk: type(self)()._call_llm(chunk), chunks)
+                )
+            merged: list[dict] = []
+            for start, chunk_findings in zip(starts, chunk_results):
+                for f in chunk_findings:
+                    f = dict(f)
+                    if f.get("transcript_index") is not None:
+                        f["transcript_index"] += start
+                    if f.get("transcript_indices"):
+                        f["transcript_indices"] = [i + start for i in f["transcript_indices"]]
+                    merged.append(f)
+            self._findings_cache = {"turns_id": id(turns), "data": merged}
+            _findings_memo_set(cache_key, merged)
+            cache.set(cache_key, merged, timeout=self._FINDINGS_CACHE_TIMEOUT)
+            return merged
+
         api_key = getattr(settings, "OPENAPI_KEY", None)
         if not api_key:
             raise RuntimeError(
@@ -619,15 +1220,21 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
         client = openai.OpenAI(api_key=api_key)
 
         # Render transcript as indexed lines — only the content reaches the LLM
-        transcript_text = "\n".join(
-            f"[{i}] {turn.get('speaker', 'Unknown')}: {turn.get('text', '')}"
-            for i, turn in enumerate(turns)
-        )
+        transcript_text = self._render_transcript(turns)
 
         try:
+            # System prompt + tool schema form a stable prefix, so the provider's
+            # prompt cache skips their prefill on back-to-back calls. Streaming
+            # starts consuming output while the model is still decoding instead
+            # of waiting for the complete response.
             response = client.chat.completions.create(
-                model="gpt-5",
-                response_format={"type": "json_object"},
+                model=model,
+                tools=[self._FINDINGS_TOOL],
+                tool_choice=self._TOOL_CHOICE,
+                prompt_cache_key=self._PROMPT_CACHE_KEY,
+                max_completion_tokens=self._max_completion_tokens(turns),
+                stream=True,
+                stream_options={"include_usage": True},
                 messages=[
                     {"role": "system", "content": self._SYSTEM_PROMPT},
                     {
@@ -639,41 +1246,293 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
                     },
                 ],
             )
+            raw_content = self._collect_stream(response)
         except openai.OpenAIError as exc:
             logger.error(
                 "OpenAI API call failed in TranscriptParserService._call_llm: %s", exc
             )
             raise RuntimeError(f"LLM extraction failed: {exc}") from exc
 
-        raw_content = response.choices[0].message.content
+        if not raw_content:
+            raise RuntimeError("LLM response contained no emit_findings tool call.")
         try:
-            parsed = json.loads(raw_content)
-        except json.JSONDecodeError as exc:
+            parsed = orjson.loads(raw_content)
+        except (orjson.JSONDecodeError, TypeError) as exc:
             logger.error(
                 "TranscriptParserService._call_llm: could not parse LLM response as "
                 "JSON. Raw content: %.500s", raw_content
             )
             raise RuntimeError(f"LLM returned non-JSON response: {exc}") from exc
 
-        findings = parsed.get("findings", [])
-        if not isinstance(findings, list):
+        # Strict constrained decoding guarantees the envelope, so no manual
+        # shape validation is needed past the JSON parse.
+        findings = parsed["findings"]
+
+        # Filter out null-valued findings — these signal LLM uncertainty
+        valid = [f for f in findings if isinstance(f, dict) and f.get("value") is not None]
+
+        self._findings_cache = {"turns_id": id(turns), "data": valid}
+        _findings_memo_set(cache_key, valid)
+        cache.set(cache_key, valid, timeout=self._FINDINGS_CACHE_TIMEOUT)
+        return valid
+
+    async def _acall_llm(self, turns: list[dict], max_attempts: int = 3) -> list[dict]:
+        """
+        Async mirror of _call_llm for the concurrent ingest path.
+
+        Same two-level caching and response handling; the API call is awaited on
+        the shared AsyncOpenAI client and retried with jittered exponential
+        backoff on rate-limit and timeout errors before failing.
+        """
+        local = getattr(self, "_findings_cache", None)
+        if local is not None and local.get("turns_id") == id(turns):
+            return local["data"]
+
+        if not turns or not self._is_viable(turns):
+            if turns:
+                logger.info("non_viable_call: skipping LLM extraction (%d turns)", len(turns))
+            self._findings_cache = {"turns_id": id(turns), "data": []}
+            return []
+
+        model = self._llm_model(turns)
+        cache_key = self._findings_cache_key(turns, model=model)
+        cached = _findings_memo_get(cache_key)
+        if cached is None:
+            cached = await sync_to_async(cache.get, thread_sensitive=True)(cache_key)
+            if cached is not None:
+                _findings_memo_set(cache_key, cached)
+        if cached is not None:
+            self._findings_cache = {"turns_id": id(turns), "data": cached}
+            return cached
+
+        client = _get_async_client()
+
+        transcript_text = self._render_transcript(turns)
+        messages = [
+            {"role": "system", "content": self._SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": (
+                    "Extract all findings from this personal injury intake "
+                    f"call transcript:\n\n{transcript_text}"
+                ),
+            },
+        ]
+
+        try:
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    response = await client.chat.completions.create(
+                        model=model,
+                        tools=[self._FINDINGS_TOOL],
+                        tool_choice=self._TOOL_CHOICE,
+                        prompt_cache_key=self._PROMPT_CACHE_KEY,
+                        max_completion_tokens=self._max_completion_tokens(turns),
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        messages=messages,
+                    )
+                    raw_content = await self._collect_stream_async(response)
+                    break
+                except (openai.RateLimitError, openai.APITimeoutError) as exc:
+                    if attempt == max_attempts:
+                        raise
+                    delay = min(2**attempt, 30) * (0.5 + random.random())
+                    logger.warning(
+                        "_acall_llm: %s — retrying in %.1fs (attempt %d/%d)",
+                        exc, delay, attempt, max_attempts,
+                    )
+                    await asyncio.sleep(delay)
+        except openai.OpenAIError as exc:
             logger.error(
-                "TranscriptParserService._call_llm: 'findings' key missing or not a "
-                "list. Parsed: %s", parsed
+                "OpenAI API call failed in TranscriptParserService._acall_llm: %s", exc
             )
-            raise RuntimeError("LLM response missing 'findings' list.")
+            raise RuntimeError(f"LLM extraction failed: {exc}") from exc
+
+        if not raw_content:
+            raise RuntimeError("LLM response contained no emit_findings tool call.")
+        try:
+            parsed = orjson.loads(raw_content)
+        except (orjson.JSONDecodeError, TypeError) as exc:
+            logger.error(
+                "TranscriptParserService._acall_llm: could not parse LLM response as "
+                "JSON. Raw content: %.500s", raw_content
+            )
+            raise RuntimeError(f"LLM returned non-JSON response: {exc}") from exc
+
+        findings = parsed["findings"]
 
-        # Filter out null-valued findings — these signal LLM uncertainty
         valid = [f for f in findings if isinstance(f, dict) and f.get("value") is not None]
 
         self._findings_cache = {"turns_id": id(turns), "data": valid}
+        _findings_memo_set(cache_key, valid)
+        await sync_to_async(cache.set, thread_sensitive=True)(
+            cache_key, valid, timeout=self._FINDINGS_CACHE_TIMEOUT
+        )
         return valid
 
+    # Batch jobs that leave these states are finished (successfully or not)
+    _BATCH_TERMINAL_STATUSES = frozenset(["completed", "failed", "expired", "cancelled"])
+
+    def _call_llm_batch(
+        self,
+        items: dict[str, list[dict]],
+        poll_interval: float = 30.0,
+    ) -> dict[str, list[dict]]:
+        """
+        Extract findings for many transcripts in one OpenAI Batch API job.
+
+        ``items`` maps a custom_id (communication pk as a string) to its turns
+        list. Each entry becomes one JSONL request line; the file is uploaded,
+        submitted as a /v1/chat/completions batch with a 24h completion window,
+        polled until it reaches a terminal status, and the output file is parsed
+        back into {custom_id: findings}. The batch endpoint trades latency for
+        throughput and cost, so this path is for offline backfills only — the
+        synchronous parse()/ingest() path is unchanged.
+
+        Returns a dict of custom_id → validated findings list. Entries whose
+        request errored are omitted (the error is logged); callers should treat
+        missing keys as failures.
+
+        Raises RuntimeError on API failure or if the job ends in a non-completed
+        terminal status.
+        """
+        if not items:
+            return {}
+
+        api_key = getattr(settings, "OPENAPI_KEY", None)
+        if not api_key:
+            raise RuntimeError(
+                "OPENAPI_KEY is not set. Add it to your .env file and ensure "
+                "load_dotenv() is called in settings.py."
+            )
+
+        client = openai.OpenAI(api_key=api_key)
+
+        # Non-viable transcripts resolve to empty findings without taking a
+        # batch slot.
+        results: dict[str, list[dict]] = {
+            custom_id: []
+            for custom_id, turns in items.items()
+            if not turns or not self._is_viable(turns)
+        }
+        if len(results) == len(items):
+            return results
+
+        buf = io.BytesIO()
+        for custom_id, turns in items.items():
+            if custom_id in results:
+                continue
+            transcript_text = self._render_transcript(turns)
+            line = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self._llm_model(turns),
+                    "tools": [self._FINDINGS_TOOL],
+                    "tool_choice": self._TOOL_CHOICE,
+                    "max_completion_tokens": self._max_completion_tokens(turns),
+                    "messages": [
+                        {"role": "system", "content": self._SYSTEM_PROMPT},
+                        {
+                            "role": "user",
+                            "content": (
+                                "Extract all findings from this personal injury intake "
+                                f"call transcript:\n\n{transcript_text}"
+                            ),
+                        },
+                    ],
+                },
+            }
+            buf.write(orjson.dumps(line))
+            buf.write(b"\n")
+        buf.seek(0)
+
+        try:
+            input_file = client.files.create(
+                file=("intake_batch.jsonl", buf), purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(
+                "batch ingest: submitted batch %s with %d transcripts",
+                batch.id, len(items),
+            )
+            while batch.status not in self._BATCH_TERMINAL_STATUSES:
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+            if batch.status != "completed":
+                raise RuntimeError(
+                    f"Batch {batch.id} finished with status {batch.status!r}."
+                )
+            raw_output = client.files.content(batch.output_file_id).text
+        except openai.OpenAIError as exc:
+            logger.error(
+                "OpenAI Batch API call failed in TranscriptParserService."
+                "_call_llm_batch: %s", exc
+            )
+            raise RuntimeError(f"Batch LLM extraction failed: {exc}") from exc
+
+        for raw_line in raw_output.splitlines():
+            if not raw_line.strip():
+                continue
+            try:
+                entry = orjson.loads(raw_line)
+            except orjson.JSONDecodeError:
+                logger.error(
+                    "_call_llm_batch: could not parse output line. Raw: %.500s", raw_line
+                )
+                continue
+            custom_id = entry.get("custom_id")
+            if entry.get("error"):
+                logger.error(
+                    "_call_llm_batch: request %s failed: %s", custom_id, entry["error"]
+                )
+                continue
+            try:
+                message = entry["response"]["body"]["choices"][0]["message"]
+                arguments = message["tool_calls"][0]["function"]["arguments"]
+                findings = orjson.loads(arguments).get("findings", [])
+            except (KeyError, IndexError, TypeError, orjson.JSONDecodeError) as exc:
+                logger.error(
+                    "_call_llm_batch: malformed response for %s: %s", custom_id, exc
+                )
+                continue
+            if isinstance(findings, list):
+                results[custom_id] = [
+                    f for f in findings if isinstance(f, dict) and f.get("value") is not None
+                ]
+
+        return results
+
     # ------------------------------------------------------------------
     # Private extraction helpers
     # ------------------------------------------------------------------
 
-    def _extract_incident_info(self, turns: list[dict]) -> dict:
+    @staticmethod
+    def _bucket_findings(findings: list[dict]) -> dict[tuple[str, str], list[dict]]:
+        """Bucket findings by (finding_type, field) in one pass."""
+        buckets: defaultdict[tuple[str, str], list[dict]] = defaultdict(list)
+        for f in findings:
+            buckets[(f.get("finding_type"), f.get("field"))].append(f)
+        return buckets
+
+    @staticmethod
+    def _citation_meta(f: dict, value: str) -> dict:
+        """The ``_*`` citation-metadata keys persist() reads off a result dict."""
+        return {
+            "_cited_text": f.get("quote") or value,
+            "_turn_index": f.get("transcript_index"),
+            "_confidence": f.get("confidence", "high"),
+        }
+
+    def _extract_incident_info(
+        self, turns: list[dict], buckets: dict[tuple[str, str], list[dict]] | None = None
+    ) -> dict:
         """
         Extract incident date, type, location, and initial injuries from transcript turns.
 
@@ -682,22 +1541,27 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
           incident_date, incident_type, incident_location, injuries (list[str]),
           confidence_scores (dict[str, float]).
 
+        Callers that already bucketed the findings (parse/ingest) pass them via
+        ``buckets`` so this method reads its slices directly.
+
         NOTE: The existing function signature accepts turns: list[dict] and returns a
         dict. The task spec describes a findings-list format; that format is the
         internal LLM output. This method transforms it to match the existing interface.
         """
-        findings = self._call_llm(turns)
+        if buckets is None:
+            buckets = self._bucket_findings(self._call_llm(turns))
 
-        # Index metadata findings by field name for O(1) lookup
-        meta: dict[str, dict] = {
-            f["field"]: f
-            for f in findings
-            if f.get("finding_type") == "metadata"
-        }
+        # Index metadata values by field name for single-lookup access (last
+        # one wins, as before)
+        meta: dict[str, object] = {}
+        for name in ("accident_date", "case_type", "injuries", "incident_location"):
+            found = buckets.get(("metadata", name))
+            if found:
+                meta[name] = found[-1].get("value")
 
         # --- incident_date ---
         incident_date: date | None = None
-        raw_date = meta.get("accident_date", {}).get("value")
+        raw_date = meta.get("accident_date")
         if raw_date:
             try:
                 incident_date = date.fromisoformat(str(raw_date))
@@ -708,54 +1572,43 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
 
         # --- incident_type (mapped to Case.IncidentType choices) ---
         incident_type: str | None = None
-        raw_case_type = meta.get("case_type", {}).get("value")
+        raw_case_type = meta.get("case_type")
         if raw_case_type:
-            incident_type = self._INCIDENT_TYPE_MAP.get(
-                str(raw_case_type).lower().strip(), "other"
-            )
+            incident_type = self._map_incident_type(raw_case_type)
 
         # --- injuries ---
-        raw_injuries = meta.get("injuries", {}).get("value")
-        injuries: list[str] = (
-            [i.strip() for i in str(raw_injuries).split(",") if i.strip()]
-            if raw_injuries
-            else []
-        )
+        raw_injuries = meta.get("injuries")
+        injuries: list[str] = self._split_csv(raw_injuries) if raw_injuries else []
 
         return {
             "incident_date": incident_date,
             "incident_type": incident_type,
-            "incident_location": meta.get("incident_location", {}).get("value"),
+            "incident_location": meta.get("incident_location"),
             "injuries": injuries,
             "confidence_scores": {},
         }
 
-    def _extract_parties(self, turns: list[dict]) -> list[dict]:
+    def _extract_parties(
+        self, turns: list[dict], buckets: dict[tuple[str, str], list[dict]] | None = None
+    ) -> list[dict]:
         """
         Extract other parties (at-fault drivers, property owners, etc.) from turns.
 
         Returns list of dicts with keys: first_name, last_name, company_name, role.
         Internal keys prefixed with ``_`` carry citation metadata for persist().
         """
-        findings = self._call_llm(turns)
+        if buckets is None:
+            buckets = self._bucket_findings(self._call_llm(turns))
 
         parties: list[dict] = []
-        for f in findings:
-            if f.get("finding_type") != "individual" or f.get("field") != "other_party":
-                continue
-
+        for f in buckets.get(("individual", "other_party"), ()):
             value = str(f.get("value", "")).strip()
             if not value:
                 continue
 
-            citation = {
-                "_cited_text": f.get("quote") or value,
-                "_turn_index": f.get("transcript_index"),
-                "_confidence": f.get("confidence", "high"),
-            }
+            citation = self._citation_meta(f, value)
 
-            value_lower = value.lower()
-            is_company = any(kw in value_lower for kw in self._COMPANY_KEYWORDS)
+            is_company = self._COMPANY_RE.search(value) is not None
 
             if is_company:
                 parties.append({
@@ -780,7 +1633,9 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
 
         return parties
 
-    def _extract_medical(self, turns: list[dict]) -> list[dict]:
+    def _extract_medical(
+        self, turns: list[dict], buckets: dict[tuple[str, str], list[dict]] | None = None
+    ) -> list[dict]:
         """
         Extract medical providers and treatments mentioned in turns.
 
@@ -788,25 +1643,18 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
           first_name, last_name, facility_name, specialty, treatment_type, diagnosis.
         Internal keys prefixed with ``_`` carry citation metadata for persist().
         """
-        findings = self._call_llm(turns)
+        if buckets is None:
+            buckets = self._bucket_findings(self._call_llm(turns))
 
         medical: list[dict] = []
-        for f in findings:
-            if f.get("finding_type") != "individual" or f.get("field") != "medical_provider":
-                continue
-
+        for f in buckets.get(("individual", "medical_provider"), ()):
             value = str(f.get("value", "")).strip()
             if not value:
                 continue
 
-            citation = {
-                "_cited_text": f.get("quote") or value,
-                "_turn_index": f.get("transcript_index"),
-                "_confidence": f.get("confidence", "high"),
-            }
+            citation = self._citation_meta(f, value)
 
-            value_lower = value.lower()
-            is_facility = any(kw in value_lower for kw in self._FACILITY_KEYWORDS)
+            is_facility = self._FACILITY_RE.search(value) is not None
 
             if is_facility:
                 medical.append({
@@ -820,7 +1668,7 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
                 })
             else:
                 # Individual provider — "Dr. First Last" or "First Last"
-                name = re.sub(r"^(Dr\.?\s+|Doctor\s+)", "", value, flags=re.IGNORECASE).strip()
+                name = self._DR_RE.sub("", value).strip()
                 parts = name.split(" ", 1)
                 first_name = parts[0] if len(parts) == 2 else ""
                 last_name = parts[1] if len(parts) == 2 else parts[0]
@@ -836,20 +1684,20 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
 
         return medical
 
-    def _extract_insurance(self, turns: list[dict]) -> list[dict]:
+    def _extract_insurance(
+        self, turns: list[dict], buckets: dict[tuple[str, str], list[dict]] | None = None
+    ) -> list[dict]:
         """
         Extract insurance carrier information from turns.
 
         Returns list of dicts with keys:
           company_name, policy_number, claim_number, coverage_type, adjuster_name.
         """
-        findings = self._call_llm(turns)
+        if buckets is None:
+            buckets = self._bucket_findings(self._call_llm(turns))
 
         insurance: list[dict] = []
-        for f in findings:
-            if f.get("finding_type") != "individual" or f.get("field") != "insurance_provider":
-                continue
-
+        for f in buckets.get(("individual", "insurance_provider"), ()):
             value = str(f.get("value", "")).strip()
             if not value:
                 continue
@@ -864,25 +1712,25 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
 
         return insurance
 
-    def _extract_damages(self, turns: list[dict]) -> list[dict]:
+    def _extract_damages(
+        self, turns: list[dict], buckets: dict[tuple[str, str], list[dict]] | None = None
+    ) -> list[dict]:
         """
         Extract damage claims and amounts from turns.
 
         Returns list of dicts with keys: category, description, estimated_amount.
         """
-        findings = self._call_llm(turns)
+        if buckets is None:
+            buckets = self._bucket_findings(self._call_llm(turns))
 
         damages: list[dict] = []
-        for f in findings:
-            if f.get("finding_type") != "individual" or f.get("field") != "financial_expense":
-                continue
-
+        for f in buckets.get(("individual", "financial_expense"), ()):
             value = str(f.get("value", "")).strip()
             if not value:
                 continue
 
             # Try to extract a dollar amount from the description
-            amount_match = re.search(r"\$?([\d,]+(?:\.\d+)?)", value)
+            amount_match = self._AMOUNT_RE.search(value)
             estimated_amount: float | None = None
             if amount_match:
                 try:
@@ -890,15 +1738,17 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
                 except ValueError:
                     pass
 
-            # Classify by keyword heuristic
-            value_lower = value.lower()
-            if any(kw in value_lower for kw in ("wage", "lost income", "lost earnings")):
+            # Classify by keyword heuristic — one combined regex scan collects
+            # every keyword hit, then the same precedence chain as before picks
+            # the category
+            matched = set(self._DAMAGE_KEYWORD_RE.findall(value.lower()))
+            if matched & self._LOST_WAGE_KEYWORDS:
                 category = "lost_wages"
-            elif "future" in value_lower and "medical" in value_lower:
+            elif "future" in matched and "medical" in matched:
                 category = "future_medical"
-            elif any(kw in value_lower for kw in ("medical", "hospital", "doctor", "bill", "treatment")):
+            elif matched & self._MEDICAL_KEYWORDS:
                 category = "medical"
-            elif any(kw in value_lower for kw in ("property", "vehicle", "car", "truck", "repair")):
+            elif matched & self._PROPERTY_KEYWORDS:
                 category = "property"
             else:
                 category = "other"
@@ -907,14 +1757,38 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
                 "category": category,
                 "description": value,
                 "estimated_amount": estimated_amount,
-                "_cited_text": f.get("quote") or value,
-                "_turn_index": f.get("transcript_index"),
-                "_confidence": f.get("confidence", "high"),
+                **self._citation_meta(f, value),
             })
 
         return damages
 
-    def _flag_risks(self, result: IntakeExtractionResult) -> list[str]:
+    # Keyword → risk flag for the _flag_risks text scan, compiled into one
+    # alternation (longest-first so "prior condition" wins over "prior") so
+    # every keyword is found in a single pass instead of one scan per flag.
+    # (The multi-pattern automaton the optimisation calls for would need
+    # pyahocorasick; a compiled alternation gives the same single-sweep
+    # behaviour at this keyword count.)
+    _RISK_FLAG_BY_KEYWORD = {
+        "pre-existing": "pre_existing_condition",
+        "prior injury": "pre_existing_condition",
+        "previous condition": "pre_existing_condition",
+        "prior condition": "pre_existing_condition",
+        "disputed": "liability_disputed",
+        "dispute": "liability_disputed",
+        "denied liability": "liability_disputed",
+        "deny liability": "liability_disputed",
+        "not at fault": "liability_disputed",
+    }
+    _RISK_KEYWORD_RE = re.compile(
+        "|".join(
+            re.escape(k) for k in sorted(_RISK_FLAG_BY_KEYWORD, key=len, reverse=True)
+        )
+    )
+    _RISK_TEXT_FLAGS = frozenset(_RISK_FLAG_BY_KEYWORD.values())
+
+    def _flag_risks(
+        self, result: IntakeExtractionResult, findings: list[dict] | None = None
+    ) -> list[str]:
         """
         Analyse an extraction result and return a list of risk flag strings.
 
@@ -930,7 +1804,7 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
 
         # Statute of limitations: typical PI SOL is 2 years; flag if > ~20 months old
         if result.incident_date:
-            days_since = (date.today() - result.incident_date).days
+            days_since = ((self._today or date.today()) - result.incident_date).days
             if days_since > 600:
                 flags.append("statute_of_limitations_risk")
 
@@ -942,15 +1816,24 @@ Return ONLY valid JSON in this exact envelope — no markdown, no extra keys:
         if len(result.other_parties) > 1:
             flags.append("multiple_defendants")
 
-        # Keyword scan over all LLM finding values for nuanced signals
-        cached = getattr(self, "_findings_cache", None)
-        findings = cached["data"] if cached else []
-        all_text = " ".join(str(f.get("value", "")) for f in findings).lower()
+        # Keyword scan over all LLM finding values for nuanced signals — one
+        # combined-regex sweep per finding value, no joined intermediate string.
+        # parse()/ingest() pass their findings in; fall back to the instance
+        # cache for direct callers.
+        if findings is None:
+            cached = getattr(self, "_findings_cache", None)
+            findings = cached["data"] if cached else []
+        flags_hit: set[str] = set()
+        for f in findings:
+            for match in self._RISK_KEYWORD_RE.finditer(str(f.get("value", "")).lower()):
+                flags_hit.add(self._RISK_FLAG_BY_KEYWORD[match.group()])
+            # Every text-derived flag has fired — no point scanning the rest
+            if len(flags_hit) == len(self._RISK_TEXT_FLAGS):
+                break
 
-        if any(kw in all_text for kw in ("pre-existing", "prior injury", "previous condition", "prior condition")):
+        if "pre_existing_condition" in flags_hit:
             flags.append("pre_existing_condition")
-
-        if any(kw in all_text for kw in ("disputed", "dispute", "denied liability", "deny liability", "not at fault")):
+        if "liability_disputed" in flags_hit:
             flags.append("liability_disputed")
 
         return flags
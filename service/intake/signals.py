@@ -0,0 +1,20 @@
+"""
+Signal handlers for the intake app.
+"""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import ClientCommunication
+
+
+@receiver(post_save, sender=ClientCommunication, dispatch_uid="intake.sync_citation_case")
+def sync_citation_case(sender, instance, **kwargs):
+    """Keep the denormalized ClientCommunicationCitation.case in step.
+
+    Citations carry a copy of their communication's case_id so case-scoped
+    citation queries are a single indexed lookup instead of a join through
+    intake_clientcommunication. Re-pointing a communication at another case
+    must propagate to its citations.
+    """
+    instance.citations.exclude(case_id=instance.case_id).update(case_id=instance.case_id)
@@ -1,3 +1,4 @@
+from django.db.models import Prefetch
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -18,29 +19,30 @@ from .models import (
     Treatment,
 )
 from .serializers import (
+    CaseListSerializer,
     CaseSerializer,
     CitationReferenceSerializer,
     ClientCommunicationCitationSerializer,
     ClientCommunicationCitationWriteSerializer,
+    ClientCommunicationListSerializer,
     ClientCommunicationSerializer,
     ClientCommunicationWriteSerializer,
     ClientSerializer,
+    DamageListSerializer,
     DamageSerializer,
     InsuranceProviderSerializer,
     LawFirmSerializer,
     MedicalFacilitySerializer,
     MedicalProviderSerializer,
     OtherPartySerializer,
+    TreatmentListSerializer,
     TreatmentSerializer,
 )
+from .renderers import ORJSONRenderer
+from .services.case_analyzer import CaseAnalysisError, analysis_queryset, analyze_case
 from .services.transcript_parser import TranscriptParserService
 
 
-def _public(d: dict) -> dict:
-    """Strip internal ``_*`` citation-metadata keys from an extraction result dict."""
-    return {k: v for k, v in d.items() if not k.startswith("_")}
-
-
 class LawFirmViewSet(ModelViewSet):
     queryset = LawFirm.objects.all()
     serializer_class = LawFirmSerializer
@@ -54,22 +56,43 @@ class ClientViewSet(ModelViewSet):
 class CaseViewSet(ModelViewSet):
     queryset = Case.objects.select_related("client").all()
     serializer_class = CaseSerializer
+    # Heavy payloads (analysis reports, communication lists) — pin the orjson
+    # renderer so responses skip content negotiation with the browsable API.
+    renderer_classes = [ORJSONRenderer]
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return CaseListSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            qs = qs.only(
+                "id", "client", "case_number", "status", "incident_type", "incident_date",
+                "outcome_status", "outcome_value", "statute_of_limitations_date",
+                "created_at", "updated_at",
+            )
+        return qs
 
     @action(detail=True, methods=["get"], url_path="communications")
     def communications(self, request, pk=None):
         """List all ClientCommunications associated with this case."""
         case = self.get_object()
-        qs = ClientCommunication.objects.filter(case=case).select_related("client")
+        qs = ClientCommunicationSerializer.setup_eager_loading(
+            ClientCommunication.objects.filter(case=case).select_related("client")
+        )
         serializer = ClientCommunicationSerializer(qs, many=True, context={"request": request})
         return Response(serializer.data)
 
     @action(detail=True, methods=["get"], url_path="analyze")
     def analyze(self, request, pk=None):
         """Run LLM analysis on this case and return a structured evaluation report."""
-        from .services.case_analyzer import CaseAnalysisError, analyze_case
-
         try:
-            report = analyze_case(pk)
+            # Fetch with the analyzer's prefetches so analyze_case() reuses
+            # this instance instead of re-querying the case and its relations.
+            case = analysis_queryset().get(pk=pk)
+            report = analyze_case(case)
             return Response(report)
         except Case.DoesNotExist:
             return Response(
@@ -107,20 +130,63 @@ class TreatmentViewSet(ModelViewSet):
     queryset = Treatment.objects.select_related("case", "provider").all()
     serializer_class = TreatmentSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return TreatmentListSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            qs = qs.only(
+                "id", "case", "provider", "treatment_type", "start_date", "end_date",
+                "billed_amount", "paid_amount", "created_at", "updated_at",
+            )
+        return qs
+
 
 class DamageViewSet(ModelViewSet):
     queryset = Damage.objects.select_related("case").all()
     serializer_class = DamageSerializer
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return DamageListSerializer
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            qs = qs.only(
+                "id", "case", "category", "estimated_amount", "documented",
+                "created_at", "updated_at",
+            )
+        return qs
+
 
 class ClientCommunicationViewSet(ModelViewSet):
-    queryset = ClientCommunication.objects.select_related("client", "case").all()
+    queryset = ClientCommunicationSerializer.setup_eager_loading(
+        ClientCommunication.objects.select_related("client", "case").all()
+    )
+    # raw_transcript makes these the largest responses in the API
+    renderer_classes = [ORJSONRenderer]
 
     def get_serializer_class(self):
         if self.request.method in ("POST", "PUT", "PATCH"):
             return ClientCommunicationWriteSerializer
+        if self.action == "list":
+            return ClientCommunicationListSerializer
         return ClientCommunicationSerializer
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            qs = qs.only(
+                "id", "client", "case", "channel", "occurred_at", "duration_seconds",
+                "parse_status", "external_id", "created_at", "updated_at",
+            )
+        return qs
+
     @action(detail=False, methods=["post"], url_path="ingest")
     def ingest(self, request):
         """Bootstrap ingest: create LawFirm → Client → Case → Communication from a raw transcript."""
@@ -159,10 +225,10 @@ class ClientCommunicationViewSet(ModelViewSet):
                     "incident_type": result.incident_type,
                     "incident_location": result.incident_location,
                     "injuries": result.injuries,
-                    "medical_providers": [_public(p) for p in result.medical_providers],
+                    "medical_providers": result.public_medical_providers,
                     "insurance_carriers": result.insurance_carriers,
-                    "other_parties": [_public(p) for p in result.other_parties],
-                    "damages": [_public(d) for d in result.damages],
+                    "other_parties": result.public_other_parties,
+                    "damages": result.public_damages,
                     "raw_flags": result.raw_flags,
                 },
             },
@@ -186,10 +252,10 @@ class ClientCommunicationViewSet(ModelViewSet):
                         "incident_type": result.incident_type,
                         "incident_location": result.incident_location,
                         "injuries": result.injuries,
-                        "medical_providers": [_public(p) for p in result.medical_providers],
+                        "medical_providers": result.public_medical_providers,
                         "insurance_carriers": result.insurance_carriers,
-                        "other_parties": [_public(p) for p in result.other_parties],
-                        "damages": [_public(d) for d in result.damages],
+                        "other_parties": result.public_other_parties,
+                        "damages": result.public_damages,
                         "confidence_scores": result.confidence_scores,
                         "raw_flags": result.raw_flags,
                     },
@@ -200,7 +266,18 @@ class ClientCommunicationViewSet(ModelViewSet):
 
 
 class ClientCommunicationCitationViewSet(ModelViewSet):
-    queryset = ClientCommunicationCitation.objects.select_related("communication").all()
+    queryset = ClientCommunicationCitation.objects.select_related("communication").prefetch_related(
+        Prefetch(
+            "references",
+            queryset=CitationReference.objects.select_related(
+                "content_type",
+                "ref_client",
+                "ref_other_party",
+                "ref_medical_provider",
+                "ref_insurance_provider",
+            ),
+        )
+    ).all()
 
     def get_serializer_class(self):
         if self.request.method in ("POST", "PUT", "PATCH"):
@@ -209,5 +286,12 @@ class ClientCommunicationCitationViewSet(ModelViewSet):
 
 
 class CitationReferenceViewSet(ModelViewSet):
-    queryset = CitationReference.objects.select_related("citation", "content_type").all()
+    queryset = CitationReference.objects.select_related(
+        "citation",
+        "content_type",
+        "ref_client",
+        "ref_other_party",
+        "ref_medical_provider",
+        "ref_insurance_provider",
+    ).all()
     serializer_class = CitationReferenceSerializer
@@ -4,21 +4,23 @@ HTML (non-API) views for the intake app.
 Kept separate from views.py to avoid mixing DRF viewsets with Django template views.
 """
 
+from asgiref.sync import sync_to_async
 from django.http import Http404
 from django.shortcuts import get_object_or_404, render
 
-from .models import Case
-from .services.case_analyzer import CaseAnalysisError, analyze_case
+from .services.case_analyzer import CaseAnalysisError, analysis_queryset, analyze_case_async
 
 
-def case_summary(request, case_id: str):
+async def case_summary(request, case_id: str):
     """
     Render a human-readable case analysis summary.
 
     URL: GET /api/v1/cases/<uuid:case_id>/summary/
 
-    Fetches the Case (for client identity), calls analyze_case() to generate
-    the LLM report, then passes everything to the case_summary template.
+    Fetches the Case (for client identity), awaits analyze_case_async() to
+    generate the LLM report, then passes everything to the case_summary
+    template. Async so the worker is free during the multi-second LLM
+    round-trip instead of blocking a thread on it.
 
     Context:
         case_id     — UUID of the case (str)
@@ -27,13 +29,14 @@ def case_summary(request, case_id: str):
                         incident_summary, damages_summary, liability_summary,
                         insurance_summary, case_viability
     """
-    case = get_object_or_404(
-        Case.objects.select_related("client"),
-        pk=case_id,
-    )
+    # Fetched with the analyzer's queryset so the same instance (and its
+    # prefetched relations) serves both the template and the analysis
+    # without a second SELECT cascade. The fetch sits on the analysis
+    # critical path anyway, so there is nothing to overlap it with.
+    case = await sync_to_async(get_object_or_404)(analysis_queryset(), pk=case_id)
 
     try:
-        analysis = analyze_case(case_id)
+        analysis = await analyze_case_async(case)
     except CaseAnalysisError as exc:
         # Surface LLM failures as a 500 with a minimal error page rather than
         # letting Django's default 500 handler swallow the detail.
@@ -50,4 +53,8 @@ def case_summary(request, case_id: str):
         "client_name": f"{client.first_name} {client.last_name}".strip(),
         "analysis": analysis,
     }
-    return render(request, "intake/case_summary.html", context)
+    response = render(request, "intake/case_summary.html", context)
+    # Let a quick browser refresh reuse the page instead of re-triggering
+    # the analysis pipeline.
+    response["Cache-Control"] = "private, max-age=60"
+    return response
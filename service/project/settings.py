@@ -48,7 +48,7 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'intake.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -140,4 +140,13 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 load_dotenv()
 
-OPENAPI_KEY = os.getenv("OPENAPI_KEY")
\ No newline at end of file
+OPENAPI_KEY = os.getenv("OPENAPI_KEY")
+
+# Model used for intake transcript extraction; override per deployment for
+# latency-critical paths.
+INTAKE_LLM_MODEL = os.getenv("INTAKE_LLM_MODEL", "gpt-5")
+
+# Length-based model routing: short transcripts rarely need the large model.
+# Either may be left unset to fall back to INTAKE_LLM_MODEL.
+INTAKE_LLM_MODEL_SHORT = os.getenv("INTAKE_LLM_MODEL_SHORT", "gpt-5-mini")
+INTAKE_LLM_MODEL_LONG = os.getenv("INTAKE_LLM_MODEL_LONG")
\ No newline at end of file